@@ -0,0 +1,199 @@
+import gc
+import linecache
+import os
+import sys
+import tracemalloc
+
+# Per-frame allocation profiler for the PLAYING and BOSS_FIGHT loops.
+# Runs the game headless with scripted input, snapshots tracemalloc around every
+# frame and reports the call sites that keep allocating once the game has warmed up.
+#
+#   python alloc_profiler.py                 # report allocations per frame by call site
+#   python alloc_profiler.py --check         # exit non-zero if a scenario is over budget
+
+# CPython starts a collection once net container allocations pass the gen0
+# threshold, so the net block count per frame is what drives GC hitches.
+# Blocks that merely replace a value freed elsewhere (e.g. a float attribute
+# being updated) are reported per call site but don't count against the budget.
+DEFAULT_BLOCK_BUDGET = 0.5  # Net new blocks per frame, averaged over the run
+DEFAULT_GC_BUDGET = 0  # Full (gen2) collections allowed during the run
+
+
+class HeldKeys:
+    # Stands in for pygame.key.get_pressed() with a fixed set of keys held down
+    def __init__(self, *held):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class Scenario:
+    def __init__(self, name, state, keys, boss_health=None):
+        self.name = name
+        self.state = state
+        self.keys = keys
+        self.boss_health = boss_health
+
+    def setup(self, game, walle):
+        game.reset()
+        game.change_state(self.state)
+        game.fps = 0
+        keys = self.keys
+        game.key_source = lambda: keys
+        if self.state == walle.GameState.BOSS_FIGHT:
+            for player in game.players:
+                player.world_x = walle.WORLD_WIDTH - 400
+
+    def before_frame(self, game, walle):
+        # Keep the run in its steady state: nobody dies and the course loops
+        for player in game.players:
+            player.health = player.max_health
+            if self.boss_health is None and player.world_x >= walle.WORLD_WIDTH - 250:
+                player.world_x = 50
+        if self.boss_health is not None:
+            game.alien.health = self.boss_health
+
+
+def make_scenarios(walle, players=1):
+    # Every player runs right and jumps
+    controls = (walle.SOLO_CONTROLS,) if players == 1 else walle.SPLIT_CONTROLS[:players]
+    run_and_jump = HeldKeys(*(key for left, right, jump in controls for key in right + jump))
+    standing = HeldKeys()
+    boss = walle.GameState.BOSS_FIGHT
+    return [
+        Scenario("playing", walle.GameState.PLAYING, run_and_jump),
+        Scenario("boss-phase-1", boss, standing, boss_health=250),
+        Scenario("boss-phase-2", boss, standing, boss_health=120),
+        Scenario("boss-phase-3", boss, standing, boss_health=50),
+    ]
+
+
+class FrameProfile:
+    def __init__(self, name):
+        self.name = name
+        self.frames = 0
+        self.blocks = 0  # Net change in live blocks
+        self.replaced = 0  # Blocks allocated at one site, whether or not another site freed one
+        self.peak_bytes = 0
+        self.max_peak_bytes = 0
+        self.collections = [0, 0, 0]
+        self.sites = {}  # (filename, lineno) -> [blocks, bytes]
+
+    def blocks_per_frame(self):
+        return self.blocks / self.frames if self.frames else 0.0
+
+    def report(self, out=sys.stdout, top=10):
+        out.write(f"{self.name}: {self.frames} frames\n")
+        out.write(f"  net new blocks per frame: {self.blocks_per_frame():.2f} "
+                  f"({self.replaced / max(self.frames, 1):.2f} replaced)\n")
+        out.write(f"  transient peak per frame: {self.peak_bytes / max(self.frames, 1) / 1024:.1f} KiB "
+                  f"(max {self.max_peak_bytes / 1024:.1f} KiB)\n")
+        out.write(f"  gc collections gen0/gen1/gen2: {self.collections[0]}/{self.collections[1]}/{self.collections[2]}\n")
+        sites = sorted(self.sites.items(), key=lambda item: -item[1][0])[:top]
+        for (filename, lineno), (blocks, size) in sites:
+            source = linecache.getline(filename, lineno).strip()
+            out.write(f"  {blocks / self.frames:8.2f} blocks/frame {size / self.frames:8.0f} B/frame  "
+                      f"{os.path.basename(filename)}:{lineno}  {source}\n")
+
+
+def step(game, walle):
+    game.handle_events()
+    game.frame()
+    walle.pygame.display.flip()
+
+
+def profile_scenario(game, walle, scenario, frames, warmup):
+    scenario.setup(game, walle)
+    for _ in range(warmup):
+        scenario.before_frame(game, walle)
+        step(game, walle)
+
+    result = FrameProfile(scenario.name)
+    # Only attribute allocations to the game's own modules, not the profiler or stdlib
+    repo_dir = os.path.dirname(os.path.abspath(walle.__file__))
+    only_game = (tracemalloc.Filter(True, os.path.join(repo_dir, "*")),
+                 tracemalloc.Filter(False, os.path.abspath(__file__)))
+
+    def count_collections(phase, info):
+        if phase == "start":
+            result.collections[info["generation"]] += 1
+
+    gc.collect()
+    tracemalloc.start(1)
+    gc.callbacks.append(count_collections)
+    try:
+        previous = tracemalloc.take_snapshot().filter_traces(only_game)
+        for _ in range(frames):
+            scenario.before_frame(game, walle)
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            step(game, walle)
+            peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+            snapshot = tracemalloc.take_snapshot().filter_traces(only_game)
+
+            for stat in snapshot.compare_to(previous, "lineno"):
+                result.blocks += stat.count_diff
+                if stat.count_diff > 0:
+                    frame = stat.traceback[0]
+                    site = result.sites.setdefault((frame.filename, frame.lineno), [0, 0])
+                    site[0] += stat.count_diff
+                    site[1] += stat.size_diff
+                    result.replaced += stat.count_diff
+            result.frames += 1
+            result.peak_bytes += peak_bytes
+            result.max_peak_bytes = max(result.max_peak_bytes, peak_bytes)
+            previous = snapshot
+    finally:
+        gc.callbacks.remove(count_collections)
+        # Sounds still playing call back into Python from SDL's audio thread
+        # when they finish, and tracemalloc.stop() can race with that callback
+        game.audio.stop()
+        tracemalloc.stop()
+    return result
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Per-frame allocation profiler for Wall-E's gameplay loops")
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=600, help="unmeasured frames before measuring")
+    parser.add_argument("--top", type=int, default=10, help="call sites listed per scenario")
+    parser.add_argument("--scenario", action="append", help="only run the named scenario(s)")
+    parser.add_argument("--check", action="store_true", help="exit non-zero if any scenario is over budget")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BLOCK_BUDGET,
+                        help="allowed net new blocks per frame")
+    parser.add_argument("--gc-budget", type=int, default=DEFAULT_GC_BUDGET,
+                        help="allowed full collections per scenario")
+    args = parser.parse_args(argv)
+
+    # Run headless; must be set before pygame is initialised
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import wall_e_rescue_game as walle
+
+    game = walle.Game()
+    failures = []
+    for scenario in make_scenarios(walle):
+        if args.scenario and scenario.name not in args.scenario:
+            continue
+        result = profile_scenario(game, walle, scenario, args.frames, args.warmup)
+        result.report(top=args.top)
+        if result.blocks_per_frame() > args.budget:
+            failures.append(f"{scenario.name}: {result.blocks_per_frame():.2f} blocks/frame > {args.budget}")
+        if result.collections[2] > args.gc_budget:
+            failures.append(f"{scenario.name}: {result.collections[2]} full collections > {args.gc_budget}")
+
+    if args.check:
+        if failures:
+            print("Allocation budget exceeded:")
+            for failure in failures:
+                print("  " + failure)
+            return 1
+        print("Allocation budget OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+import math
+import random
+import sys
+import threading
+import time
+from array import array
+
+import pygame
+
+# Sound effects. Every sample is synthesised and decoded into a mixer Sound once
+# at load, and playback goes through a fixed pool of channels with per-sound
+# priorities and rate limits, so triggering a sound is a few lookups and a
+# channel scan on the game thread.
+
+NUM_CHANNELS = 8
+
+# name -> (priority, minimum ms between plays, volume)
+SOUNDS = {
+    'jump': (2, 100, 0.5),
+    'obstacle_hit': (1, 250, 0.4),
+    'shot': (1, 80, 0.3),
+    'triple_shot': (1, 80, 0.35),
+    'spread_shot': (1, 80, 0.35),
+    'homing': (3, 200, 0.5),
+    'laser': (3, 200, 0.5),
+    'shield': (4, 500, 0.6),
+    'phase_change': (5, 1000, 0.8),
+    'victory': (6, 2000, 0.8),
+}
+
+
+class NullAudio:
+    # Used when audio is disabled or no mixer is available
+    enabled = False
+
+    def play(self, name):
+        return False
+
+    def stop(self):
+        pass
+
+
+NULL_AUDIO = NullAudio()
+
+
+def synthesize(name, rate):
+    # Returns mono 16-bit samples for one of the SOUNDS
+    if name == 'jump':
+        return sweep(rate, 0.15, 300, 700, 'square')
+    if name == 'obstacle_hit':
+        return sweep(rate, 0.12, 120, 80, 'noise')
+    if name == 'shot':
+        return sweep(rate, 0.10, 900, 400, 'square')
+    if name == 'triple_shot':
+        return sweep(rate, 0.14, 800, 300, 'square')
+    if name == 'spread_shot':
+        return sweep(rate, 0.18, 700, 200, 'saw')
+    if name == 'homing':
+        return sweep(rate, 0.35, 200, 600, 'saw')
+    if name == 'laser':
+        return sweep(rate, 0.25, 1800, 600, 'sine')
+    if name == 'shield':
+        return sweep(rate, 0.40, 400, 900, 'sine')
+    if name == 'phase_change':
+        return sweep(rate, 0.60, 500, 90, 'saw')
+    if name == 'victory':
+        notes = array('h')
+        for freq in (523, 659, 784, 1047):  # C major arpeggio
+            notes.extend(sweep(rate, 0.18, freq, freq, 'square'))
+        return notes
+    raise KeyError(name)
+
+
+def sweep(rate, duration, start_freq, end_freq, wave):
+    count = int(rate * duration)
+    samples = array('h', bytes(2 * count))
+    phase = 0.0
+    for i in range(count):
+        t = i / count
+        freq = start_freq + (end_freq - start_freq) * t
+        phase += freq / rate
+        if wave == 'sine':
+            value = math.sin(2 * math.pi * phase)
+        elif wave == 'square':
+            value = 1.0 if phase % 1.0 < 0.5 else -1.0
+        elif wave == 'saw':
+            value = 2.0 * (phase % 1.0) - 1.0
+        else:
+            value = random.uniform(-1.0, 1.0)
+        # Short attack, linear decay
+        envelope = min(1.0, i / (rate * 0.005)) * (1.0 - t)
+        samples[i] = int(value * envelope * 12000)
+    return samples
+
+
+class AudioSystem:
+    enabled = True
+
+    def __init__(self, num_channels=NUM_CHANNELS):
+        settings = pygame.mixer.get_init()
+        if settings is None:
+            pygame.mixer.init()
+            settings = pygame.mixer.get_init()
+        self.rate, self.format, self.output_channels = settings
+
+        self.sounds = {}
+        self.priorities = {}
+        self.intervals = {}
+        self.last_played = {}
+        for name, (priority, interval, volume) in SOUNDS.items():
+            samples = synthesize(name, self.rate)
+            if self.output_channels > 1:
+                # Interleave the mono samples across every output channel
+                interleaved = array('h', bytes(2 * len(samples) * self.output_channels))
+                for channel in range(self.output_channels):
+                    interleaved[channel::self.output_channels] = samples
+                samples = interleaved
+            sound = pygame.mixer.Sound(buffer=samples.tobytes())
+            sound.set_volume(volume)
+            self.sounds[name] = sound
+            self.priorities[name] = priority
+            self.intervals[name] = interval / 1000
+            self.last_played[name] = -math.inf
+
+        pygame.mixer.set_num_channels(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self.channel_priorities = [0] * num_channels
+        self.played = 0
+        self.stolen = 0
+        self.rate_limited = 0
+        self.dropped = 0
+
+    def play(self, name):
+        now = time.perf_counter()
+        if now - self.last_played[name] < self.intervals[name]:
+            self.rate_limited += 1
+            return False
+
+        priority = self.priorities[name]
+        victim = -1
+        victim_priority = priority + 1
+        channels = self.channels
+        for i in range(len(channels)):
+            if not channels[i].get_busy():
+                victim = i
+                break
+            # Otherwise remember the lowest-priority voice we are allowed to steal
+            if self.channel_priorities[i] < victim_priority:
+                victim = i
+                victim_priority = self.channel_priorities[i]
+        else:
+            if victim < 0:
+                self.dropped += 1
+                return False
+            self.stolen += 1
+
+        channels[victim].play(self.sounds[name])
+        self.channel_priorities[victim] = priority
+        self.last_played[name] = now
+        self.played += 1
+        return True
+
+    def stop(self):
+        for channel in self.channels:
+            channel.stop()
+
+
+def create_audio():
+    # Audio is optional: fall back to silence if there is no usable mixer
+    try:
+        return AudioSystem()
+    except pygame.error:
+        return NULL_AUDIO
+
+
+class AudioLoader:
+    # Decodes the samples on a background thread, so the window can show its
+    # first frame meanwhile. Silent until the samples are ready; nothing plays
+    # during the intro anyway. The mixer itself starts on the calling thread,
+    # as SDL expects its subsystems to be initialised from one thread.
+    enabled = True
+
+    def __init__(self):
+        self.system = NULL_AUDIO
+        self.thread = None
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return
+        self.thread = threading.Thread(target=self._load, name="audio-loader", daemon=True)
+        self.thread.start()
+
+    def _load(self):
+        self.system = create_audio()
+
+    def wait(self):
+        # Blocks until loading has finished; returns the AudioSystem (or NULL_AUDIO)
+        if self.thread is not None:
+            self.thread.join()
+        return self.system
+
+    def play(self, name):
+        return self.system.play(name)
+
+    def stop(self):
+        self.wait().stop()
+
+
+def main(argv=None):
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Measure the cost of triggering sounds")
+    parser.add_argument("--calls", type=int, default=100000, help="play() calls to time")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.mixer.init()
+    started = time.perf_counter()
+    audio = AudioSystem()
+    print(f"Loaded {len(audio.sounds)} sounds in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    names = list(SOUNDS)
+    for label in ("rate limited", "unthrottled"):
+        started = time.perf_counter()
+        for i in range(args.calls):
+            audio.play(names[i % len(names)])
+        elapsed = time.perf_counter() - started
+        print(f"play() {label}: {elapsed / args.calls * 1e6:.2f} us per call over {args.calls} calls")
+        # Second pass measures the full path: every call plays or steals a voice
+        for name in names:
+            audio.intervals[name] = 0
+    print(f"played {audio.played}, stolen {audio.stolen}, rate limited {audio.rate_limited}, dropped {audio.dropped}")
+    pygame.mixer.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
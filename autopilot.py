@@ -0,0 +1,80 @@
+import pygame
+
+# Built-in autopilot: plays the course and the boss fight by reading obstacle
+# positions and Alien.projectiles, and restarts the game whenever a run ends.
+# It stands in for pygame.key.get_pressed() through Game.key_source.
+
+JUMP_DISTANCE = 30  # Jump when an obstacle is this close in front of Wall-E
+DODGE_DISTANCE = 90  # Jump over projectiles that get this close at ground level
+MENU_KEY_DELAY = 30  # Frames to wait on the intro / end screens before pressing a key
+
+
+class Autopilot:
+    def __init__(self, game, walle):
+        self.game = game
+        self.walle = walle
+        self.held = set()
+        self.menu_frames = 0
+        self.runs = 0
+
+    def install(self):
+        self.game.key_source = self
+        return self
+
+    def __call__(self):
+        # Called by the game in place of pygame.key.get_pressed()
+        self.held.clear()
+        if self.game.state == self.walle.GameState.PLAYING:
+            self.play_course()
+        elif self.game.state == self.walle.GameState.BOSS_FIGHT:
+            self.fight_boss()
+        return self
+
+    def __getitem__(self, key):
+        return key in self.held
+
+    def pump(self):
+        # Press through the intro and restart after GAME_OVER / VICTORY
+        state = self.game.state
+        GameState = self.walle.GameState
+        if state in (GameState.INTRO, GameState.GAME_OVER, GameState.VICTORY):
+            self.menu_frames += 1
+            if self.menu_frames >= MENU_KEY_DELAY:
+                self.menu_frames = 0
+                key = pygame.K_s if state == GameState.INTRO else pygame.K_r
+                if key == pygame.K_r:
+                    self.runs += 1
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
+        else:
+            self.menu_frames = 0
+
+    def play_course(self):
+        player = self.game.player
+        self.held.add(pygame.K_RIGHT)
+        front = player.world_x + player.width
+        for obstacle in self.game.obstacles:
+            gap = obstacle.world_x - front
+            if 0 <= gap <= JUMP_DISTANCE:
+                self.held.add(pygame.K_SPACE)
+                break
+
+    def fight_boss(self):
+        player = self.game.player
+        alien = self.game.alien
+        player_center = player.world_x + player.width / 2
+        alien_center = alien.world_x + alien.width / 2
+
+        # Close in on the alien and jump into it to attack
+        if alien_center < player_center - 10:
+            self.held.add(pygame.K_LEFT)
+        elif alien_center > player_center + 10:
+            self.held.add(pygame.K_RIGHT)
+        if abs(alien_center - player_center) < alien.width:
+            self.held.add(pygame.K_SPACE)
+
+        # Hop over anything heading for Wall-E at ground level
+        for proj in alien.projectiles:
+            dx = proj.x - player_center
+            if abs(dx) < DODGE_DISTANCE and proj.y > player.y - 30 and dx * proj.dx < 0:
+                self.held.add(pygame.K_SPACE)
+                break
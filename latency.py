@@ -0,0 +1,214 @@
+import math
+import random
+import sys
+import threading
+import time
+from collections import deque
+
+import pygame
+
+# Frame pacing and input-to-display latency.
+#
+# ClockPacer is the original loop: run the frame, then sleep off the rest of it
+# with Clock.tick(). LowLatencyPacer sleeps *before* the frame instead, for
+# just long enough that the frame finishes right on its deadline, so input is
+# sampled as late as possible. LatencyTracker stamps every key press and
+# records how long it took to reach the flip that shows its effect.
+#
+#   python latency.py                        # compare both pacers headless
+
+SPIN_SECONDS = 0.002  # Sleep until this close to a deadline, then spin
+WORK_HISTORY = 60  # Frames of work time used to predict the next frame's
+DEFAULT_RENDER_AHEAD = 0.001  # Safety margin on top of the predicted frame time
+PERCENTILES = (50, 90, 99)
+INJECTED_KEY = pygame.K_F12  # Key pressed by the benchmark; no scene reacts to it
+
+
+def wait_until(deadline, spin=SPIN_SECONDS):
+    # time.sleep() can overshoot by a millisecond or more, so sleep most of the
+    # way and spin for the rest
+    remaining = deadline - time.perf_counter()
+    if remaining > spin:
+        time.sleep(remaining - spin)
+    while time.perf_counter() < deadline:
+        pass
+
+
+class ClockPacer:
+    def __init__(self, clock):
+        self.clock = clock
+
+    def begin_frame(self, fps):
+        pass
+
+    def end_frame(self, fps):
+        self.clock.tick(fps)
+
+
+class LowLatencyPacer:
+    def __init__(self, render_ahead=DEFAULT_RENDER_AHEAD):
+        self.render_ahead = render_ahead
+        self.work = deque(maxlen=WORK_HISTORY)  # Recent frame times, pump to flip
+        self.deadline = 0.0
+        self.frame_start = 0.0
+        self.missed = 0  # Frames that finished after their deadline
+
+    def predicted_work(self):
+        # Plan for the slowest recent frame, so a normal frame never misses
+        return (max(self.work) if self.work else 0.0) + self.render_ahead
+
+    def begin_frame(self, fps):
+        if fps > 0:
+            # Deadlines sit on a fixed 1/fps grid; take the next one there is
+            # still time to render for and start only just early enough to make it
+            period = 1 / fps
+            predicted = self.predicted_work()
+            deadline = math.ceil((time.perf_counter() + predicted) / period) * period
+            self.deadline = max(deadline, self.deadline + period)
+            wait_until(self.deadline - predicted)
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self, fps):
+        now = time.perf_counter()
+        self.work.append(now - self.frame_start)
+        if fps > 0 and now > self.deadline:
+            self.missed += 1
+
+
+def percentile(ordered, pct):
+    index = min(len(ordered) - 1, int(math.ceil(pct / 100 * len(ordered))) - 1)
+    return ordered[max(index, 0)]
+
+
+class NullLatencyTracker:
+    def observe(self, event):
+        pass
+
+    def presented(self):
+        pass
+
+
+NULL_LATENCY = NullLatencyTracker()
+
+
+class LatencyTracker:
+    def __init__(self, refresh=None):
+        # With refresh set, a flip is counted as shown at the next vblank of a
+        # display refreshing at that rate, as it would be with vsync
+        self.refresh = refresh
+        self.waiting = []  # Stamps of key presses not yet on screen
+        self.samples = []
+
+    def observe(self, event):
+        # Called for every event the game handles. Events posted by the
+        # benchmark carry the time they were sent; real key presses are stamped
+        # when the game pumps them.
+        if event.type == pygame.KEYDOWN:
+            self.waiting.append(getattr(event, 'sent', None) or time.perf_counter())
+
+    def presented(self):
+        # Called right after the flip
+        if self.waiting:
+            shown = time.perf_counter()
+            if self.refresh:
+                period = 1 / self.refresh
+                shown = math.ceil(shown / period) * period
+            for stamp in self.waiting:
+                self.samples.append(shown - stamp)
+            self.waiting.clear()
+
+    def summary(self):
+        if not self.samples:
+            return {'count': 0}
+        ordered = sorted(self.samples)
+        summary = {'count': len(ordered)}
+        for pct in PERCENTILES:
+            summary[f'p{pct}_ms'] = percentile(ordered, pct) * 1000
+        summary['max_ms'] = ordered[-1] * 1000
+        return summary
+
+    def report(self, label="input-to-display latency", out=sys.stdout):
+        summary = self.summary()
+        if not summary['count']:
+            out.write(f"{label}: no key presses recorded\n")
+            return
+        values = "  ".join(f"p{pct} {summary[f'p{pct}_ms']:6.2f} ms" for pct in PERCENTILES)
+        out.write(f"{label}: {values}  max {summary['max_ms']:6.2f} ms  ({summary['count']} presses)\n")
+
+
+class KeyInjector:
+    # Presses INJECTED_KEY at random moments from another thread, stamping each press
+    def __init__(self, rate):
+        self.rate = rate  # Presses per second
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name="key-injector", daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def _run(self):
+        while not self.stopped.wait(random.expovariate(self.rate)):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=INJECTED_KEY, mod=0, unicode='',
+                                                 scancode=0, sent=time.perf_counter()))
+
+
+def measure(game, walle, pacer, seconds, rate, refresh):
+    # Plays the course with the given pacer while keys are pressed in the background
+    game.reset()
+    game.change_state(walle.GameState.PLAYING)
+    game.pacer = pacer
+    game.latency = tracker = LatencyTracker(refresh)
+    pygame.event.clear()
+    injector = KeyInjector(rate).start()
+    frames = 0
+    started = time.perf_counter()
+    try:
+        while time.perf_counter() - started < seconds:
+            game.player.health = game.player.max_health
+            if game.player.world_x >= walle.WORLD_WIDTH - 250:
+                game.player.world_x = 50
+            game.step()
+            frames += 1
+    finally:
+        injector.stop()
+    return tracker, frames / (time.perf_counter() - started)
+
+
+def main(argv=None):
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Compare input-to-display latency of the frame pacers")
+    parser.add_argument("--seconds", type=float, default=10, help="how long to play with each pacer")
+    parser.add_argument("--rate", type=float, default=20, help="key presses per second")
+    parser.add_argument("--refresh", type=float, default=60,
+                        help="count flips as shown at the next vblank of this refresh rate (0: at the flip)")
+    parser.add_argument("--render-ahead", type=float, default=DEFAULT_RENDER_AHEAD * 1000,
+                        help="low-latency safety margin in ms")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import wall_e_rescue_game as walle
+    from alloc_profiler import HeldKeys
+
+    game = walle.Game(audio=walle.NULL_AUDIO)
+    keys = HeldKeys(pygame.K_RIGHT, pygame.K_SPACE)
+    game.key_source = lambda: keys
+    pacers = (("clock", ClockPacer(game.clock)),
+              ("low-latency", LowLatencyPacer(args.render_ahead / 1000)))
+    for name, pacer in pacers:
+        tracker, fps = measure(game, walle, pacer, args.seconds, args.rate, args.refresh or None)
+        tracker.report(f"{name:>11}")
+        missed = f", {pacer.missed} missed deadlines" if isinstance(pacer, LowLatencyPacer) else ""
+        print(f"{'':>11}  {fps:.1f} fps{missed}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,8 @@
-import pygame
-pygame.init()
-screen = pygame.display.set_mode((800, 600))
-pygame.display.set_caption("Wall-E and Eva - Rescue Mission")
+import sys
 
-running = True
-while running:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-    screen.fill((0, 0, 0))
-    pygame.display.flip()
-pygame.quit()
\ No newline at end of file
+from wall_e_rescue_game import main
+
+# Entry point: python main.py [--players 2] [--mute] ...
+# See python main.py --help for every option.
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+import sys
+import time
+
+import pygame
+
+# Render command buffer. Draw code records blits, fills and shape draws into a
+# RenderBuffer instead of touching the screen; once per frame the buffer is
+# submitted to a backend, which executes it layer by layer. PygameBackend
+# batches consecutive blits into one Surface.blits() call and merges or drops
+# redundant fills; NullBackend throws everything away, so simulation and draw
+# submission can be timed without rasterization.
+
+# Layers are executed bottom to top. Within a layer commands run in the order
+# they were recorded, except in SORTED_LAYERS, whose contents never overlap in
+# a way that matters and are grouped by surface instead. A buffer can be
+# submitted with a vertical offset, which moves everything below LAYER_HUD.
+LAYER_BACKGROUND = 0
+LAYER_GROUND = 1
+LAYER_OBSTACLES = 2
+LAYER_ACTORS = 3
+LAYER_PROJECTILES = 4
+LAYER_HUD = 5
+NUM_LAYERS = 6
+SORTED_LAYERS = (LAYER_OBSTACLES, LAYER_PROJECTILES)
+
+# Command kinds
+BLIT = 0
+FILL = 1
+SHAPE = 2
+
+
+class Command:
+    # Commands are recycled from frame to frame, so recording one doesn't allocate
+    __slots__ = ('kind', 'rect', 'pair', 'color', 'function', 'args')
+
+    def __init__(self):
+        self.kind = BLIT
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Blit destination or fill area
+        self.pair = [None, self.rect]  # (surface, dest) item for Surface.blits()
+        self.color = None
+        self.function = None
+        self.args = None
+
+
+def state_key(command):
+    # Groups blits of the same surface together in sorted layers
+    if command.kind == BLIT:
+        return id(command.pair[0])
+    return 0
+
+
+class RenderBuffer:
+    def __init__(self):
+        self.layers = [[] for _ in range(NUM_LAYERS)]
+        self.counts = [0] * NUM_LAYERS  # Commands recorded per layer this frame
+        self.commands = 0
+
+    def next_command(self, layer):
+        commands = self.layers[layer]
+        count = self.counts[layer]
+        self.counts[layer] = count + 1
+        self.commands += 1
+        if count == len(commands):
+            commands.append(Command())
+        return commands[count]
+
+    def blit(self, layer, surface, dest):
+        # dest is copied, so callers can keep reusing one scratch rect
+        command = self.next_command(layer)
+        command.kind = BLIT
+        command.pair[0] = surface
+        command.rect.x = dest[0]
+        command.rect.y = dest[1]
+
+    def fill(self, layer, color, rect):
+        # Same result as pygame.draw.rect(screen, color, rect) for opaque colours
+        command = self.next_command(layer)
+        command.kind = FILL
+        command.color = color
+        command.rect.update(rect)
+
+    def draw(self, layer, function, *args):
+        # Any pygame.draw function: function(screen, *args) runs when the buffer executes
+        command = self.next_command(layer)
+        command.kind = SHAPE
+        command.function = function
+        command.args = args
+
+    def submit(self, backend, surface, offset_y=0):
+        # Executes the buffer onto `surface`; offset_y shifts the world layers
+        # (blits and fills only), for viewports that show part of the world's height
+        for layer in SORTED_LAYERS:
+            count = self.counts[layer]
+            if count > 1:
+                commands = self.layers[layer]
+                commands[:count] = sorted(commands[:count], key=state_key)
+        if offset_y:
+            for layer in range(LAYER_HUD):
+                commands = self.layers[layer]
+                for i in range(self.counts[layer]):
+                    commands[i].rect.y += offset_y
+        backend.execute(self, surface)
+        for layer in range(NUM_LAYERS):
+            self.counts[layer] = 0
+        self.commands = 0
+
+
+class NullBackend:
+    # Discards every command
+    def execute(self, buffer, surface):
+        pass
+
+
+NULL_BACKEND = NullBackend()
+
+
+class PygameBackend:
+    def __init__(self):
+        self.screen = None  # Surface being drawn to, for the duration of execute()
+        self.batch = []  # (surface, dest) items for the next Surface.blits() call
+        self.pending = pygame.Rect(0, 0, 0, 0)  # Fill held back for merging
+        self.pending_color = None
+        self.calls = 0  # Blit batches, fills and shape draws actually issued
+        self.merged_fills = 0  # Fills merged into a neighbour or dropped as covered
+
+    def execute(self, buffer, surface):
+        self.screen = screen = surface
+        batch = self.batch
+        for layer in range(NUM_LAYERS):
+            commands = buffer.layers[layer]
+            # A fill is held back until the next command, so it can be merged
+            # with a neighbouring fill on the same row or trimmed where the next
+            # fill paints over it
+            pending = False
+            for i in range(buffer.counts[layer]):
+                command = commands[i]
+                kind = command.kind
+                if kind == BLIT:
+                    if pending:
+                        self.fill()
+                        pending = False
+                    batch.append(command.pair)
+                    continue
+                if batch:
+                    self.blits()
+                if kind == FILL:
+                    if not pending or not self.merge(command):
+                        if pending:
+                            self.fill()
+                        self.pending.update(command.rect)
+                        self.pending_color = command.color
+                        pending = True
+                else:
+                    if pending:
+                        self.fill()
+                        pending = False
+                    command.function(screen, *command.args)
+                    self.calls += 1
+            if batch:
+                self.blits()
+            if pending:
+                self.fill()
+        self.screen = None
+
+    def merge(self, command):
+        # Folds a fill into the pending one; False if both have to be issued
+        pending = self.pending
+        rect = command.rect
+        if pending.y != rect.y or pending.height != rect.height:
+            return False
+        if command.color == self.pending_color and rect.x <= pending.right and rect.right >= pending.x:
+            # Touching or overlapping fills of one colour become one fill
+            pending.union_ip(rect)
+            self.merged_fills += 1
+            return True
+        if rect.x <= pending.x and rect.right >= pending.right:
+            # The pending fill is painted over completely
+            pending.update(rect)
+            self.pending_color = command.color
+            self.merged_fills += 1
+            return True
+        if rect.x <= pending.x < rect.right:
+            # Only the part of the pending fill right of this one stays visible
+            right = pending.right
+            pending.x = rect.right
+            pending.width = right - rect.right
+        return False
+
+    def fill(self):
+        if self.pending.width > 0 and self.pending.height > 0:
+            self.screen.fill(self.pending_color, self.pending)
+            self.calls += 1
+
+    def blits(self):
+        self.screen.blits(self.batch, False)
+        self.calls += 1
+        self.batch.clear()
+
+
+def main(argv=None):
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description="Split frame time into simulation, draw submission and rasterization")
+    parser.add_argument("--frames", type=int, default=600, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=120, help="unmeasured frames before measuring")
+    parser.add_argument("--players", type=int, action="append",
+                        help="split-screen player counts to measure (default: 1)")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import wall_e_rescue_game as walle
+    from alloc_profiler import make_scenarios
+
+    for players in args.players or [1]:
+        game = walle.Game(audio=walle.NULL_AUDIO, players=players)
+        backend = game.render_backend
+        buffers = [game.render] + [viewport.render for viewport in game.viewports]
+        for scenario in make_scenarios(walle, players):
+            scenario.setup(game, walle)
+            for _ in range(args.warmup):
+                scenario.before_frame(game, walle)
+                game.frame()
+            update_time = submit_time = execute_time = 0.0
+            commands = 0
+            calls, merged = backend.calls, backend.merged_fills
+            for _ in range(args.frames):
+                scenario.before_frame(game, walle)
+                # The steps of Game.frame(), timed separately
+                scene = game.scene
+                started = time.perf_counter()
+                game.scheduler.tick()
+                scene.update()
+                updated = time.perf_counter()
+                game.record(scene)
+                for buffer in buffers:
+                    commands += buffer.commands
+                recorded = time.perf_counter()
+                game.submit(backend)
+                finished = time.perf_counter()
+                update_time += updated - started
+                submit_time += recorded - updated
+                execute_time += finished - recorded
+            # Same frames against the null backend, to confirm the draw path costs nothing without a rasterizer
+            null_time = 0.0
+            for _ in range(args.frames):
+                scenario.before_frame(game, walle)
+                scene = game.scene
+                started = time.perf_counter()
+                game.scheduler.tick()
+                scene.update()
+                game.record(scene)
+                game.submit(NULL_BACKEND)
+                null_time += time.perf_counter() - started
+
+            frames = args.frames
+            total = update_time + submit_time + execute_time
+            print(f"{scenario.name}, {players} viewport(s): {frames} frames, {total / frames * 1000:.3f} ms/frame")
+            print(f"  simulation       {update_time / frames * 1000:7.3f} ms/frame")
+            print(f"  draw submission  {submit_time / frames * 1000:7.3f} ms/frame  "
+                  f"({commands / frames:.1f} commands)")
+            print(f"  rasterization    {execute_time / frames * 1000:7.3f} ms/frame  "
+                  f"({(backend.calls - calls) / frames:.1f} draw calls, "
+                  f"{(backend.merged_fills - merged) / frames:.1f} fills merged)")
+            print(f"  null backend     {null_time / frames * 1000:7.3f} ms/frame total")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
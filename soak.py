@@ -0,0 +1,196 @@
+import gc
+import os
+import sys
+import time
+
+# Multi-hour soak run: the autopilot plays the game in a loop while RSS, live
+# objects, projectiles, surfaces and frame time are sampled. The run fails if
+# any of them keeps trending upward once the game has warmed up.
+#
+#   python soak.py --hours 4                 # real-time, paced at the game's FPS
+#   python soak.py --minutes 5 --fast        # unpaced smoke run
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Allowed growth from the first third of the samples to the last third
+TOLERANCES = {
+    'rss_kb': 0.10,
+    'objects': 0.05,
+    'surfaces': 0.05,
+    'projectiles': 0.50,
+    'frame_ms': 0.25,
+}
+# Growth below these absolute amounts is always treated as noise
+NOISE_FLOOR = {
+    'rss_kb': 2048,
+    'objects': 200,
+    'surfaces': 2,
+    'projectiles': 10,
+    'frame_ms': 1.0,
+}
+
+
+def read_rss_kb():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss // 1024
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        # Peak rather than current RSS, but still catches steady growth
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def count_surfaces(surface_type):
+    # Surfaces aren't tracked by the GC, so find them through the containers that hold them
+    seen = set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if type(ref) is surface_type:
+                seen.add(id(ref))
+    return len(seen)
+
+
+def median(values):
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def find_trends(samples, warmup):
+    # Compare the start and end of the run; medians keep restarts and GC sawtooth from tripping it
+    failures = []
+    measured = samples[warmup:]
+    if len(measured) < 6:
+        return failures
+    third = len(measured) // 3
+    for metric, tolerance in TOLERANCES.items():
+        start = median([sample[metric] for sample in measured[:third]])
+        end = median([sample[metric] for sample in measured[-third:]])
+        growth = end - start
+        if growth > NOISE_FLOOR[metric] and growth > abs(start) * tolerance:
+            failures.append(f"{metric} grew from {start:.1f} to {end:.1f}")
+    return failures
+
+
+class SoakRun:
+    def __init__(self, game, walle, autopilot, sample_every, realtime):
+        self.game = game
+        self.walle = walle
+        self.autopilot = autopilot
+        self.sample_every = sample_every
+        self.realtime = realtime
+        self.samples = []
+        self.frames = 0
+        self.window_frame_time = 0.0
+        self.window_max_frame_time = 0.0
+        self.window_max_projectiles = 0
+
+    def step(self):
+        start = time.perf_counter()
+        self.autopilot.pump()
+        self.game.handle_events()
+        self.game.frame()
+        self.walle.pygame.display.flip()
+        elapsed = time.perf_counter() - start
+        if self.realtime:
+            self.game.clock.tick(self.game.fps)
+
+        self.frames += 1
+        self.window_frame_time += elapsed
+        self.window_max_frame_time = max(self.window_max_frame_time, elapsed)
+        self.window_max_projectiles = max(self.window_max_projectiles, len(self.game.alien.projectiles))
+        if self.frames % self.sample_every == 0:
+            self.sample()
+
+    def sample(self):
+        sample = {
+            'frame': self.frames,
+            'rss_kb': read_rss_kb(),
+            'objects': len(gc.get_objects()),
+            'surfaces': count_surfaces(self.walle.pygame.Surface),
+            'projectiles': self.window_max_projectiles,
+            'frame_ms': self.window_frame_time / self.sample_every * 1000,
+            'max_frame_ms': self.window_max_frame_time * 1000,
+            'runs': self.autopilot.runs,
+        }
+        self.samples.append(sample)
+        self.window_frame_time = 0.0
+        self.window_max_frame_time = 0.0
+        self.window_max_projectiles = 0
+        return sample
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Autopilot soak run with leak and drift detection")
+    duration = parser.add_mutually_exclusive_group()
+    duration.add_argument("--hours", type=float, help="how long to play")
+    duration.add_argument("--minutes", type=float, help="how long to play")
+    duration.add_argument("--frames", type=int, help="how many frames to play")
+    parser.add_argument("--fast", action="store_true", help="don't pace frames to the game's FPS")
+    parser.add_argument("--sample-every", type=int, default=600, help="frames between samples")
+    parser.add_argument("--warmup-samples", type=int, default=3, help="samples ignored by trend detection")
+    parser.add_argument("--csv", metavar="PATH", help="write every sample to a CSV file")
+    parser.add_argument("--quiet", action="store_true", help="only print the final verdict")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import wall_e_rescue_game as walle
+    from autopilot import Autopilot
+
+    game = walle.Game()
+    autopilot = Autopilot(game, walle).install()
+    soak = SoakRun(game, walle, autopilot, args.sample_every, realtime=not args.fast)
+
+    if args.frames:
+        frame_limit, time_limit = args.frames, None
+    else:
+        frame_limit = None
+        time_limit = (args.hours or 0) * 3600 + (args.minutes or 0) * 60 or 3600
+
+    started = time.monotonic()
+    while True:
+        soak.step()
+        if frame_limit is not None and soak.frames >= frame_limit:
+            break
+        if time_limit is not None and soak.frames % 60 == 0 and time.monotonic() - started >= time_limit:
+            break
+        if not args.quiet and soak.frames % args.sample_every == 0:
+            sample = soak.samples[-1]
+            print(f"frame {sample['frame']:>9}  runs {sample['runs']:>5}  rss {sample['rss_kb']:>8} KiB  "
+                  f"objects {sample['objects']:>7}  surfaces {sample['surfaces']:>4}  "
+                  f"projectiles {sample['projectiles']:>3}  frame {sample['frame_ms']:6.2f} ms "
+                  f"(max {sample['max_frame_ms']:6.2f})", flush=True)
+
+    if args.csv:
+        import csv
+        with open(args.csv, "w", newline="") as out:
+            writer = csv.DictWriter(out, fieldnames=list(soak.samples[0]) if soak.samples else ['frame'])
+            writer.writeheader()
+            writer.writerows(soak.samples)
+
+    failures = find_trends(soak.samples, args.warmup_samples)
+    print(f"Soak: {soak.frames} frames, {autopilot.runs} restarts, {len(soak.samples)} samples "
+          f"in {time.monotonic() - started:.0f}s")
+    if len(soak.samples) - args.warmup_samples < 6:
+        print("Not enough samples to detect trends; run longer or sample more often")
+    if failures:
+        print("Upward trends detected:")
+        for failure in failures:
+            print("  " + failure)
+        return 1
+    print("No upward trends")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
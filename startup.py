@@ -0,0 +1,130 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Cold-start benchmark. Launches the game in fresh interpreters, the way
+# main.py does, and times each step up to the first INTRO frame on screen -
+# the point where the game is drawing and reading input.
+#
+#   python startup.py                        # report startup times over a few launches
+#   python startup.py --check                # exit non-zero if startup is over budget
+#
+# Launch times are measured from just before the interpreter is spawned, so
+# they include Python's own startup. time.perf_counter() is a system-wide
+# monotonic clock, so the parent's and the child's readings can be compared.
+
+DEFAULT_LAUNCHES = 5
+DEFAULT_IMPORT_BUDGET = 20  # ms to import the game module on top of pygame
+DEFAULT_FIRST_FRAME_BUDGET = 600  # ms from launch to the first INTRO frame
+
+# (key, label) in the order the steps happen
+STEPS = (
+    ('interpreter', "interpreter start"),
+    ('pygame_import', "import pygame"),
+    ('game_import', "import the game"),
+    ('game_ready', "create the Game"),
+    ('first_frame', "first INTRO frame"),
+    ('audio_ready', "sounds loaded"),
+)
+
+
+def launch_child(started, argv):
+    # Runs in the spawned interpreter: main.py's steps up to the first frame.
+    # Prints how long after `started` each step finished, in ms.
+    stamps = {'interpreter': time.perf_counter()}
+    import pygame
+    stamps['pygame_import'] = time.perf_counter()
+    import wall_e_rescue_game as walle
+    stamps['game_import'] = time.perf_counter()
+    # Importing must not start any subsystem
+    initialized = [name for name, module in (('display', pygame.display), ('font', pygame.font))
+                   if module.get_init()]
+    if pygame.mixer.get_init():
+        initialized.append('mixer')
+
+    game = walle.create_game(walle.parse_args(argv))
+    stamps['game_ready'] = time.perf_counter()
+    game.step()
+    stamps['first_frame'] = time.perf_counter()
+    if hasattr(game.audio, 'wait'):
+        game.audio.wait()
+        stamps['audio_ready'] = time.perf_counter()
+    pygame.quit()
+
+    result = {key: (stamp - started) * 1000 for key, stamp in stamps.items()}
+    result['initialized_at_import'] = initialized
+    print(json.dumps(result))
+
+
+def launch(game_args):
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", repr(started), *game_args],
+                            env=env, check=True, stdout=subprocess.PIPE, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv=None):
+    import argparse
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["--child"]:
+        launch_child(float(argv[1]), argv[2:])
+        return 0
+
+    parser = argparse.ArgumentParser(description="Measure Wall-E's cold start and time to the first frame",
+                                     epilog="Arguments after -- are passed to the game, e.g. -- --mute")
+    parser.add_argument("--launches", type=int, default=DEFAULT_LAUNCHES, help="fresh interpreters to launch")
+    parser.add_argument("--check", action="store_true", help="exit non-zero if startup is over budget")
+    parser.add_argument("--import-budget", type=float, default=DEFAULT_IMPORT_BUDGET,
+                        help="allowed median ms to import the game module, not counting pygame")
+    parser.add_argument("--first-frame-budget", type=float, default=DEFAULT_FIRST_FRAME_BUDGET,
+                        help="allowed median ms from launch to the first INTRO frame")
+    parser.add_argument("game_args", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    # Run headless; inherited by the launched interpreters
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    results = [launch(args.game_args) for _ in range(args.launches)]
+    print(f"{args.launches} launches, ms after launch (median / min / max):")
+    for key, label in STEPS:
+        times = [result[key] for result in results if key in result]
+        if times:
+            print(f"  {label:<20} {statistics.median(times):8.1f} {min(times):8.1f} {max(times):8.1f}")
+    # Import times on their own: pygame's, which the game can't do much about,
+    # and the game module's on top of it, which is budgeted
+    pygame_times = [result['pygame_import'] - result['interpreter'] for result in results]
+    import_times = [result['game_import'] - result['pygame_import'] for result in results]
+    print("import times, ms:")
+    for label, times in (("pygame", pygame_times), ("game module", import_times)):
+        print(f"  {label:<20} {statistics.median(times):8.1f} {min(times):8.1f} {max(times):8.1f}")
+    import_time = statistics.median(import_times)
+    first_frame = statistics.median(result['first_frame'] for result in results)
+
+    failures = []
+    initialized = sorted({name for result in results for name in result['initialized_at_import']})
+    if initialized:
+        failures.append(f"importing the game initialized: {', '.join(initialized)}")
+    if import_time > args.import_budget:
+        failures.append(f"game module import {import_time:.1f} ms > {args.import_budget} ms")
+    if first_frame > args.first_frame_budget:
+        failures.append(f"first INTRO frame after {first_frame:.1f} ms > {args.first_frame_budget} ms")
+
+    if args.check:
+        if failures:
+            print("Startup budget exceeded:")
+            for failure in failures:
+                print("  " + failure)
+            return 1
+        print("Startup budget OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import json
+import queue
+import sys
+import threading
+import time
+
+# Gameplay telemetry: events are queued by the game loop and written to an
+# append-only JSONL log by a background thread, so the game never waits on disk.
+
+_STOP = object()
+
+
+class NullTelemetry:
+    # Used when telemetry is disabled - every call is a no-op
+    def emit(self, event, **fields):
+        pass
+
+    def close(self):
+        pass
+
+
+NULL_TELEMETRY = NullTelemetry()
+
+
+class Telemetry:
+    def __init__(self, path, flush_interval=0.5, buffer_size=64 * 1024):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.start_time = time.perf_counter()
+        self.queue = queue.SimpleQueue()
+        self.closed = False
+        # Opened here rather than by the writer, so a bad path fails at startup
+        self.log = open(path, 'a', buffering=buffer_size)
+        self.writer = threading.Thread(target=self._write_loop, name="telemetry-writer", daemon=True)
+        self.writer.start()
+
+    def emit(self, event, **fields):
+        # Called from the game loop: only stamps the event and hands it off
+        if self.closed:
+            return
+        fields['event'] = event
+        fields['t'] = time.perf_counter() - self.start_time
+        self.queue.put(fields)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(_STOP)
+        self.writer.join()
+
+    def _write_loop(self):
+        encode = json.JSONEncoder(separators=(',', ':')).encode
+        try:
+            with self.log as log:
+                while True:
+                    try:
+                        item = self.queue.get(timeout=self.flush_interval)
+                    except queue.Empty:
+                        log.flush()
+                        continue
+                    # Drain whatever else is already waiting before touching the file
+                    while item is not _STOP:
+                        item['t'] = round(item['t'], 4)
+                        log.write(encode(item))
+                        log.write('\n')
+                        try:
+                            item = self.queue.get_nowait()
+                        except queue.Empty:
+                            break
+                    if item is _STOP:
+                        break
+                log.flush()
+        finally:
+            # If writing fails, stop queueing events nobody will write
+            self.closed = True
+
+
+class TelemetryReport:
+    # Streaming aggregator: memory is bounded by the heatmap grid, not the log size
+    def __init__(self, bucket_size=50):
+        self.bucket_size = bucket_size
+        self.events = 0
+        self.bad_lines = 0
+        self.heatmap = {}  # (bucket_x, bucket_y) -> damage taken
+        self.damage_by_source = {}  # obstacle/projectile type -> damage taken
+        self.hits_by_source = {}
+        self.shield_blocks = 0
+        self.shield_blocked_damage = 0
+        self.phase_entries = {0: 0, 1: 0, 2: 0, 3: 0}  # phase 0 is the obstacle course
+        self.phase_deaths = {0: 0, 1: 0, 2: 0, 3: 0}
+        self.victories = 0
+        self.runs_finished = 0
+        self.total_duration = 0.0
+        self.longest_run = 0.0
+
+    def add_line(self, line):
+        line = line.strip()
+        if not line:
+            return
+        try:
+            event = json.loads(line)
+        except ValueError:
+            self.bad_lines += 1
+            return
+        self.add(event)
+
+    def add(self, event):
+        self.events += 1
+        kind = event.get('event')
+        if kind == 'obstacle_hit' or kind == 'projectile_hit':
+            source = event.get('type', 'unknown')
+            damage = event.get('damage', 0)
+            cell = (int(event.get('x', 0)) // self.bucket_size, int(event.get('y', 0)) // self.bucket_size)
+            self.heatmap[cell] = self.heatmap.get(cell, 0) + damage
+            self.damage_by_source[source] = self.damage_by_source.get(source, 0) + damage
+            self.hits_by_source[source] = self.hits_by_source.get(source, 0) + 1
+        elif kind == 'shield_block':
+            self.shield_blocks += 1
+            self.shield_blocked_damage += event.get('damage', 0)
+        elif kind == 'run_start':
+            self.phase_entries[0] += 1
+        elif kind == 'boss_start':
+            self.phase_entries[1] += 1
+        elif kind == 'phase_change':
+            phase = event.get('to')
+            if phase in self.phase_entries:
+                self.phase_entries[phase] += 1
+        elif kind == 'death':
+            phase = event.get('phase', 0)
+            if phase in self.phase_deaths:
+                self.phase_deaths[phase] += 1
+        elif kind == 'victory':
+            self.victories += 1
+        elif kind == 'run_end':
+            duration = event.get('duration', 0.0)
+            self.runs_finished += 1
+            self.total_duration += duration
+            self.longest_run = max(self.longest_run, duration)
+
+    def death_rates(self):
+        rates = {}
+        for phase, entries in self.phase_entries.items():
+            rates[phase] = self.phase_deaths[phase] / entries if entries else 0.0
+        return rates
+
+    def summary(self):
+        return {
+            'events': self.events,
+            'bad_lines': self.bad_lines,
+            'bucket_size': self.bucket_size,
+            'heatmap': [[bx * self.bucket_size, by * self.bucket_size, damage]
+                        for (bx, by), damage in sorted(self.heatmap.items())],
+            'damage_by_source': self.damage_by_source,
+            'hits_by_source': self.hits_by_source,
+            'shield_blocks': self.shield_blocks,
+            'shield_blocked_damage': self.shield_blocked_damage,
+            'phase_entries': self.phase_entries,
+            'phase_deaths': self.phase_deaths,
+            'death_rates': self.death_rates(),
+            'victories': self.victories,
+            'runs_finished': self.runs_finished,
+            'average_run_duration': self.total_duration / self.runs_finished if self.runs_finished else 0.0,
+            'longest_run': self.longest_run,
+        }
+
+    def print_report(self, out=sys.stdout, top=10):
+        phase_names = {0: "Obstacle course", 1: "Boss phase 1", 2: "Boss phase 2", 3: "Boss phase 3"}
+        out.write(f"Events: {self.events} ({self.bad_lines} unreadable lines)\n")
+        out.write(f"Runs finished: {self.runs_finished}, victories: {self.victories}\n")
+        if self.runs_finished:
+            out.write(f"Average run: {self.total_duration / self.runs_finished:.1f}s, longest: {self.longest_run:.1f}s\n")
+
+        out.write("\nDeath rate by phase:\n")
+        rates = self.death_rates()
+        for phase, name in phase_names.items():
+            out.write(f"  {name:<16} {self.phase_deaths[phase]:>7} / {self.phase_entries[phase]:<7} {rates[phase] * 100:6.1f}%\n")
+
+        out.write("\nDamage by source:\n")
+        for source, damage in sorted(self.damage_by_source.items(), key=lambda item: -item[1]):
+            out.write(f"  {source:<10} {damage:10.1f} over {self.hits_by_source[source]} hits\n")
+        out.write(f"  Shield blocked {self.shield_blocks} hits ({self.shield_blocked_damage} damage)\n")
+
+        out.write(f"\nHottest {self.bucket_size}px cells (world x, y):\n")
+        hottest = sorted(self.heatmap.items(), key=lambda item: -item[1])[:top]
+        for (bx, by), damage in hottest:
+            out.write(f"  ({bx * self.bucket_size:>5}, {by * self.bucket_size:>4})  {damage:10.1f}\n")
+
+
+def aggregate(paths, bucket_size=50):
+    report = TelemetryReport(bucket_size)
+    for path in paths:
+        with open(path) as log:
+            for line in log:
+                report.add_line(line)
+    return report
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Aggregate a Wall-E telemetry log")
+    parser.add_argument("log", nargs="+", help="JSONL telemetry log(s) written by the game")
+    parser.add_argument("--bucket", type=int, default=50, help="heatmap cell size in pixels")
+    parser.add_argument("--top", type=int, default=10, help="number of heatmap cells to list")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+
+    report = aggregate(args.log, args.bucket)
+    if args.json:
+        json.dump(report.summary(), sys.stdout, indent=2)
+        sys.stdout.write('\n')
+    else:
+        report.print_report(top=args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import os
+import unittest
+
+# Enforces the per-frame allocation budget from alloc_profiler.py on a shorter
+# run than `python alloc_profiler.py --check`, so it can run with the rest of
+# the checks:
+#
+#   python -m pytest test_alloc_budget.py
+#   python -m unittest test_alloc_budget
+
+# Run headless; must be set before pygame is initialised
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import alloc_profiler
+import wall_e_rescue_game as walle
+
+WARMUP_FRAMES = 300  # Long enough for pools and caches to fill
+MEASURED_FRAMES = 240
+
+
+class AllocationBudgetTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = walle.Game()  # Same setup as alloc_profiler.py, sounds included
+
+    @classmethod
+    def tearDownClass(cls):
+        walle.pygame.quit()
+
+    def test_scenarios_within_budget(self):
+        for scenario in alloc_profiler.make_scenarios(walle):
+            with self.subTest(scenario=scenario.name):
+                result = alloc_profiler.profile_scenario(self.game, walle, scenario,
+                                                         MEASURED_FRAMES, WARMUP_FRAMES)
+                self.assertLessEqual(result.blocks_per_frame(), alloc_profiler.DEFAULT_BLOCK_BUDGET)
+                self.assertLessEqual(result.collections[2], alloc_profiler.DEFAULT_GC_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import heapq
+
+# Tick-based timer scheduler. Entities register cooldowns and callbacks once;
+# Scheduler.tick() advances the clock and only does work for timers that are
+# actually due, so an idle entity costs nothing per frame.
+#
+# Timers live in a heap keyed by due tick. Cancelling, pausing or rescheduling
+# a timer just marks its heap entry stale; stale entries are skipped when they
+# reach the top and the heap is compacted if too many build up.
+
+
+class Timer:
+    __slots__ = ('scheduler', 'callback', 'interval', 'due', 'remaining', 'entry', 'active')
+
+    def __init__(self, scheduler, callback, interval):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.interval = interval  # Ticks between firings; None for a one-shot timer
+        self.due = 0
+        self.remaining = 0  # Ticks left when paused
+        self.entry = None  # The heap entry that is currently live for this timer
+        self.active = False
+
+    @property
+    def scheduled(self):
+        return self.entry is not None
+
+    @property
+    def paused(self):
+        return self.active and self.entry is None
+
+    def ticks_left(self):
+        if self.entry is None:
+            return self.remaining
+        return self.due - self.scheduler.now
+
+    def reschedule(self, delay, interval=...):
+        # Fire `delay` ticks from now; optionally change the repeat interval too
+        if interval is not ...:
+            self.interval = interval
+        self.active = True
+        self.scheduler._push(self, max(1, delay))
+
+    def set_interval(self, interval):
+        # Change how often a repeating timer fires, keeping the time already waited
+        if self.interval is not None and self.entry is not None:
+            waited = self.interval - (self.due - self.scheduler.now)
+            self.interval = interval
+            self.scheduler._push(self, max(1, interval - waited))
+        else:
+            self.interval = interval
+
+    def pause(self):
+        if self.entry is not None:
+            self.remaining = max(1, self.due - self.scheduler.now)
+            self.scheduler._discard(self)
+
+    def resume(self):
+        if self.active and self.entry is None:
+            self.scheduler._push(self, self.remaining)
+
+    def cancel(self):
+        self.active = False
+        if self.entry is not None:
+            self.scheduler._discard(self)
+
+
+class Scheduler:
+    def __init__(self):
+        self.now = 0
+        self.heap = []
+        self.sequence = 0  # Breaks ties so timers due on the same tick fire in order
+        self.stale = 0
+
+    def after(self, delay, callback, paused=False):
+        # One-shot timer
+        return self._add(callback, None, delay, paused)
+
+    def every(self, interval, callback, delay=None, paused=False):
+        # Repeating timer; the first firing is `delay` ticks away (default: one interval)
+        return self._add(callback, interval, interval if delay is None else delay, paused)
+
+    def tick(self):
+        self.now += 1
+        heap = self.heap
+        while heap and heap[0][0] <= self.now:
+            entry = heapq.heappop(heap)
+            timer = entry[2]
+            if timer.entry is not entry:
+                self.stale -= 1
+                continue
+            if timer.interval is None:
+                timer.entry = None
+                timer.active = False
+            else:
+                self._push(timer, timer.interval, replacing=False)
+            timer.callback()
+
+    def _add(self, callback, interval, delay, paused):
+        timer = Timer(self, callback, interval)
+        timer.active = True
+        if paused:
+            timer.remaining = max(1, delay)
+        else:
+            self._push(timer, max(1, delay))
+        return timer
+
+    def _push(self, timer, delay, replacing=True):
+        if replacing and timer.entry is not None:
+            self.stale += 1
+        timer.due = self.now + delay
+        self.sequence += 1
+        timer.entry = (timer.due, self.sequence, timer)
+        heapq.heappush(self.heap, timer.entry)
+        self._compact()
+
+    def _discard(self, timer):
+        timer.entry = None
+        self.stale += 1
+        self._compact()
+
+    def _compact(self):
+        if self.stale > 32 and self.stale * 2 > len(self.heap):
+            # In place: tick() may be partway through popping this heap
+            self.heap[:] = [entry for entry in self.heap if entry[2].entry is entry]
+            heapq.heapify(self.heap)
+            self.stale = 0
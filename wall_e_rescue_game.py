@@ -2,9 +2,17 @@ import pygame
 import sys
 import random
 import math
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from audio import NULL_AUDIO, AudioLoader, create_audio
+from latency import NULL_LATENCY, ClockPacer, LatencyTracker, LowLatencyPacer
+from render import (LAYER_ACTORS, LAYER_BACKGROUND, LAYER_GROUND, LAYER_HUD, LAYER_OBSTACLES,
+                    LAYER_PROJECTILES, PygameBackend, RenderBuffer)
+from telemetry import NULL_TELEMETRY, Telemetry
+from timers import Scheduler
 
-# Initialize Pygame
-pygame.init()
+# Nothing is initialized at import: Game starts the SDL subsystems it uses, so
+# tools can import the entity classes without opening a window
 
 # Constants
 SCREEN_WIDTH = 1024
@@ -35,8 +43,45 @@ class GameState:
     GAME_OVER = 3
     VICTORY = 4
 
+# Projectile spread patterns, kept as constants so attacks don't build new lists
+TRIPLE_SHOT_ANGLES = (-0.3, 0, 0.3)
+# Rage-mode spread: five shots from -0.8 to 0.8 radians at speed 6
+SPREAD_SHOT_VELOCITIES = tuple((math.cos((i - 2) * 0.4) * 6, math.sin((i - 2) * 0.4) * 6) for i in range(5))
+PROJECTILE_POOL_SIZE = 64  # Enough for a phase 3 volley, so the fight never allocates projectiles
+
+# Controls as (left, right, jump) keys. A single player can use either set of
+# keys; in split-screen every player gets their own
+SOLO_CONTROLS = ((pygame.K_LEFT, pygame.K_a), (pygame.K_RIGHT, pygame.K_d), (pygame.K_SPACE, pygame.K_UP, pygame.K_w))
+SPLIT_CONTROLS = (
+    ((pygame.K_a,), (pygame.K_d,), (pygame.K_w, pygame.K_SPACE)),
+    ((pygame.K_LEFT,), (pygame.K_RIGHT,), (pygame.K_UP,)),
+    ((pygame.K_j,), (pygame.K_l,), (pygame.K_i,)),
+    ((pygame.K_KP4,), (pygame.K_KP6,), (pygame.K_KP8,)),
+)
+# Viewport rects for each supported player count: side by side for two, a 2x2 grid for four
+SPLIT_LAYOUTS = {
+    1: ((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT),),
+    2: ((0, 0, SCREEN_WIDTH // 2, SCREEN_HEIGHT), (SCREEN_WIDTH // 2, 0, SCREEN_WIDTH // 2, SCREEN_HEIGHT)),
+    4: ((0, 0, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), (SCREEN_WIDTH // 2, 0, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
+        (0, SCREEN_HEIGHT // 2, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
+        (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)),
+}
+
+projectile_x = attrgetter('x')
+
+def make_sprite(width, height):
+    return pygame.Surface((width, height), pygame.SRCALPHA)
+
+def any_pressed(keys, bindings):
+    for key in bindings:
+        if keys[key]:
+            return True
+    return False
+
 class Player:
-    def __init__(self, x, y):
+    sprite = None  # Drawn once, shared by every Player
+    
+    def __init__(self, x, y, telemetry=NULL_TELEMETRY, audio=NULL_AUDIO, controls=SOLO_CONTROLS):
         self.x = x
         self.y = y
         self.width = 40
@@ -49,20 +94,37 @@ class Player:
         self.jump_power = -15
         self.gravity = 0.8
         self.world_x = x  # Position in the world
+        self.left_keys, self.right_keys, self.jump_keys = controls
+        self.telemetry = telemetry
+        self.audio = audio
+        # Rects are updated in place instead of rebuilt every frame
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.world_rect = pygame.Rect(x, y, self.width, self.height)
         
-    def update(self, obstacles, camera_x):
-        keys = pygame.key.get_pressed()
+    @classmethod
+    def load_sprite(cls):
+        if cls.sprite is None:
+            # Draw Wall-E as a simple robot shape
+            sprite = pygame.Surface((40, 40))
+            sprite.fill(GRAY)
+            pygame.draw.rect(sprite, YELLOW, (5, 5, 10, 10))  # Eyes
+            pygame.draw.rect(sprite, YELLOW, (25, 5, 10, 10))
+            pygame.draw.rect(sprite, BLACK, (10, 20, 20, 5))  # Mouth
+            cls.sprite = sprite
+        return cls.sprite
         
+    def update(self, obstacles, keys):
         # Horizontal movement
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if any_pressed(keys, self.left_keys):
             self.world_x -= self.speed
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if any_pressed(keys, self.right_keys):
             self.world_x += self.speed
             
         # Jumping
-        if (keys[pygame.K_SPACE] or keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground:
+        if self.on_ground and any_pressed(keys, self.jump_keys):
             self.vel_y = self.jump_power
             self.on_ground = False
+            self.audio.play('jump')
             
         # Apply gravity
         self.vel_y += self.gravity
@@ -77,75 +139,112 @@ class Player:
         # World boundaries
         self.world_x = max(0, min(self.world_x, WORLD_WIDTH - self.width))
         
-        # Screen position relative to camera
-        self.x = self.world_x - camera_x
-        
         # Check obstacle collisions
-        player_rect = pygame.Rect(self.world_x, self.y, self.width, self.height)
+        player_rect = self.get_world_rect()
         for obstacle in obstacles:
             if player_rect.colliderect(obstacle.get_world_rect()):
+                damage = 0
                 if obstacle.type == "fire":
-                    self.health -= 0.3  # Reduced damage
+                    damage = 0.3  # Reduced damage
                 elif obstacle.type == "water":
-                    self.health -= 0.2  # Reduced damage
+                    damage = 0.2  # Reduced damage
                 elif obstacle.type == "trap":
-                    self.health -= 0.5  # Reduced damage
+                    damage = 0.5  # Reduced damage
+                self.health -= damage
+                self.telemetry.emit('obstacle_hit', type=obstacle.type, x=self.world_x, y=self.y, damage=damage)
+                self.audio.play('obstacle_hit')
                     
         # Clamp health
         self.health = max(0, min(self.health, self.max_health))
         
-    def draw(self, screen):
+    def draw(self, render, camera_x):
+        # Screen position relative to camera
+        self.x = self.world_x - camera_x
+        
         # Only draw if on screen
         if -50 <= self.x <= SCREEN_WIDTH + 50:
-            # Draw Wall-E as a simple robot shape
-            pygame.draw.rect(screen, GRAY, (self.x, self.y, self.width, self.height))
-            pygame.draw.rect(screen, YELLOW, (self.x + 5, self.y + 5, 10, 10))  # Eyes
-            pygame.draw.rect(screen, YELLOW, (self.x + 25, self.y + 5, 10, 10))
-            pygame.draw.rect(screen, BLACK, (self.x + 10, self.y + 20, 20, 5))  # Mouth
+            render.blit(LAYER_ACTORS, self.sprite or self.load_sprite(), self.get_rect())
         
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        rect = self.rect
+        rect.x = self.x
+        rect.y = self.y
+        return rect
     
     def get_world_rect(self):
-        return pygame.Rect(self.world_x, self.y, self.width, self.height)
+        rect = self.world_rect
+        rect.x = self.world_x
+        rect.y = self.y
+        return rect
 
 class Obstacle:
+    sprites = {}  # (type, width, height) -> sprite
+    
     def __init__(self, x, y, width, height, obstacle_type):
         self.world_x = x  # Position in world coordinates
         self.y = y
         self.width = width
         self.height = height
         self.type = obstacle_type
-        self.animation_timer = 0
         self.x = 0  # Screen position (calculated during draw)
+        # Obstacles never move, so their world rect is built once
+        self.world_rect = pygame.Rect(x, y, width, height)
+        self.rect = pygame.Rect(0, y, width, height)
+        self.sprite = None
         
-    def update(self):
-        self.animation_timer += 1
+    @classmethod
+    def load_sprite(cls, obstacle_type, width, height):
+        key = (obstacle_type, width, height)
+        sprite = cls.sprites.get(key)
+        if sprite is None:
+            sprite = make_sprite(width, height)
+            if obstacle_type == "fire":
+                # Simple fire effect
+                sprite.fill(RED)
+                pygame.draw.rect(sprite, ORANGE, (5, 5, width - 10, height - 10))
+            elif obstacle_type == "water":
+                sprite.fill(BLUE)
+                pygame.draw.rect(sprite, CYAN, (0, 0, width, 5))
+            elif obstacle_type == "trap":
+                sprite.fill(PURPLE)
+            cls.sprites[key] = sprite
+        return sprite
         
-    def draw(self, screen, camera_x):
+    def draw(self, render, camera_x):
         # Calculate screen position
         self.x = self.world_x - camera_x
         
         # Only draw if on screen
         if -100 <= self.x <= SCREEN_WIDTH + 100:
-            if self.type == "fire":
-                # Simple fire effect
-                pygame.draw.rect(screen, RED, (self.x, self.y, self.width, self.height))
-                pygame.draw.rect(screen, ORANGE, (self.x + 5, self.y + 5, self.width - 10, self.height - 10))
-            elif self.type == "water":
-                pygame.draw.rect(screen, BLUE, (self.x, self.y, self.width, self.height))
-                pygame.draw.rect(screen, CYAN, (self.x, self.y, self.width, 5))
-            elif self.type == "trap":
-                pygame.draw.rect(screen, PURPLE, (self.x, self.y, self.width, self.height))
+            if self.sprite is None:
+                self.sprite = self.load_sprite(self.type, self.width, self.height)
+            render.blit(LAYER_OBSTACLES, self.sprite, self.get_rect())
             
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.x = self.x
+        return self.rect
     
     def get_world_rect(self):
-        return pygame.Rect(self.world_x, self.y, self.width, self.height)
+        return self.world_rect
+
+class Projectile:
+    # Projectiles are recycled through Alien.projectile_pool rather than reallocated
+    __slots__ = ('x', 'y', 'dx', 'dy', 'type', 'lifetime')
+    
+    def __init__(self):
+        self.x = 0
+        self.y = 0
+        self.dx = 0
+        self.dy = 0
+        self.type = 'normal'
+        self.lifetime = None
 
 class Alien:
-    def __init__(self, x, y):
+    sprites = None  # Body sprites for phase 1, phase 2 and the two rage-mode flash colours
+    shield_sprite = None
+    projectile_sprites = None  # type -> (sprite, radius)
+    
+    def __init__(self, x, y, scheduler, telemetry=NULL_TELEMETRY, audio=NULL_AUDIO):
         self.world_x = x
         self.y = y
         self.width = 60
@@ -153,21 +252,85 @@ class Alien:
         self.health = 250  # Much higher health for challenging fight
         self.max_health = 250
         self.speed = 3  # Faster movement
-        self.attack_timer = 0
         self.attack_cooldown = 45  # Faster attacks (0.75 seconds)
         self.projectiles = []
+        self.projectile_pool = [Projectile() for _ in range(PROJECTILE_POOL_SIZE)]
+        self.projectile_xs = [0.0] * PROJECTILE_POOL_SIZE  # x of each sorted projectile; only grows
         self.x = 0  # Screen position
         self.phase = 1  # Boss phases for escalating difficulty
-        self.special_attack_timer = 0
-        self.teleport_timer = 0
-        self.shield_timer = 0
         self.shield_active = False
+        self.players = ()  # Everyone in the fight, set when it starts
+        self.target = None  # The player being attacked
         self.rage_mode = False
+        self.telemetry = telemetry
+        self.audio = audio
+        self.rect = pygame.Rect(0, y, self.width, self.height)
+        self.world_rect = pygame.Rect(x, y, self.width, self.height)
+        self.hit_rect = pygame.Rect(0, 0, 0, 0)  # Scratch rect for projectile collisions
+        self.blit_rect = pygame.Rect(0, 0, 0, 0)  # Scratch rect for sprite positions
         
-    def update(self, player, camera_x):
-        self.x = self.world_x - camera_x
+        # Attack patterns run off the scheduler and stay paused until the fight
+        # starts; enter_phase() switches them on and off as the boss escalates
+        self.attack_timer = scheduler.every(self.attack_cooldown, self.attack, paused=True)
+        self.special_attack_timer = scheduler.every(240, self.special_attack, paused=True)  # Every 4 seconds
+        self.teleport_timer = scheduler.every(300, self.teleport, paused=True)  # Every 5 seconds
+        self.shield_timer = scheduler.every(600, self.raise_shield, paused=True)  # Every 10 seconds
+        self.shield_off_timer = scheduler.after(180, self.lower_shield, paused=True)  # Shield lasts 3 seconds
+        self.timers = (self.attack_timer, self.special_attack_timer, self.teleport_timer,
+                       self.shield_timer, self.shield_off_timer)
+        
+    @classmethod
+    def load_sprites(cls):
+        if cls.sprites is None:
+            sprites = []
+            # Phase 1 green, phase 2 orange, phase 3 flashes between two reds
+            for phase, alien_color in ((1, GREEN), (2, (255, 165, 0)), (3, (255, 0, 0)), (3, (255, 100, 100))):
+                # 15px of headroom above the body for the spikes
+                sprite = make_sprite(60, 95)
+                pygame.draw.ellipse(sprite, alien_color, (0, 15, 60, 80))
+                
+                # Eyes - more menacing in higher phases
+                eye_color = RED if phase < 3 else (255, 255, 0)  # Yellow eyes in rage mode
+                pygame.draw.circle(sprite, eye_color, (15, 35), 8)
+                pygame.draw.circle(sprite, eye_color, (45, 35), 8)
+                
+                # Add spikes/details for higher phases
+                if phase >= 2:
+                    for i in range(3):
+                        spike_x = 10 + i * 20
+                        pygame.draw.polygon(sprite, BLACK, [(spike_x, 10), (spike_x + 5, 0), (spike_x + 10, 10)])
+                sprites.append(sprite)
+            cls.sprites = sprites
+            
+            cls.shield_sprite = make_sprite(80, 100)
+            pygame.draw.ellipse(cls.shield_sprite, (0, 255, 255, 100), (0, 0, 80, 100))  # Cyan with transparency
+            
+            projectile_sprites = {}
+            homing = make_sprite(24, 24)  # Homing missiles are larger and red
+            pygame.draw.circle(homing, RED, (12, 12), 12)
+            pygame.draw.circle(homing, YELLOW, (12, 12), 6)
+            projectile_sprites['homing'] = (homing, 12)
+            laser = make_sprite(12, 12)  # Laser beams are bright and elongated
+            pygame.draw.circle(laser, WHITE, (6, 6), 6)
+            pygame.draw.circle(laser, CYAN, (6, 6), 3)
+            projectile_sprites['laser'] = (laser, 6)
+            normal = make_sprite(16, 16)
+            pygame.draw.circle(normal, PURPLE, (8, 8), 8)
+            projectile_sprites['normal'] = (normal, 8)
+            cls.projectile_sprites = projectile_sprites
+        return cls.sprites
+        
+    def update(self):
+        # Go after whoever is closest
+        target = self.target
+        for player in self.players:
+            if player.health > 0 and (target.health <= 0 or
+                                      abs(player.world_x - self.world_x) < abs(target.world_x - self.world_x)):
+                target = player
+        self.target = target
         
         # Determine boss phase based on health
+        previous_phase = self.phase
         if self.health <= self.max_health * 0.3:  # 30% health
             self.phase = 3
             self.rage_mode = True
@@ -175,6 +338,10 @@ class Alien:
             self.phase = 2
         else:
             self.phase = 1
+        if self.phase != previous_phase:
+            self.telemetry.emit('phase_change', to=self.phase, health=self.health, x=target.world_x)
+            self.audio.play('phase_change')
+            self.enter_phase(self.phase)
         
         # Enhanced movement patterns based on phase
         if self.phase == 1:
@@ -183,91 +350,127 @@ class Alien:
         elif self.phase == 2:
             # Phase 2: More aggressive movement + occasional teleport
             self.y += math.sin(pygame.time.get_ticks() * 0.008) * 3
-            self.teleport_timer += 1
-            if self.teleport_timer >= 300:  # Teleport every 5 seconds
-                self.teleport_timer = 0
-                # Teleport to random position near player
-                self.world_x = player.world_x + random.randint(-200, 200)
-                self.world_x = max(WORLD_WIDTH - 400, min(self.world_x, WORLD_WIDTH - 50))
         else:
             # Phase 3: Rage mode - erratic movement
             self.y += math.sin(pygame.time.get_ticks() * 0.012) * 4
             self.world_x += math.sin(pygame.time.get_ticks() * 0.003) * 2
             self.world_x = max(WORLD_WIDTH - 400, min(self.world_x, WORLD_WIDTH - 50))
         
-        # Shield mechanic (Phase 2+)
-        if self.phase >= 2:
-            self.shield_timer += 1
-            if self.shield_timer >= 600:  # Shield every 10 seconds
-                self.shield_active = True
-                self.shield_timer = 0
-            elif self.shield_timer >= 180:  # Shield lasts 3 seconds
-                self.shield_active = False
-        
-        # Attack patterns based on phase
-        self.attack_timer += 1
-        attack_frequency = self.attack_cooldown // self.phase  # Faster attacks in higher phases
-        
-        if self.attack_timer >= attack_frequency:
-            self.attack_timer = 0
-            if self.phase == 1:
-                self.create_single_projectile(player)
-            elif self.phase == 2:
-                self.create_triple_shot(player)
-            else:  # Phase 3
-                self.create_spread_shot(player)
-        
-        # Special attacks
-        self.special_attack_timer += 1
-        if self.phase >= 2 and self.special_attack_timer >= 240:  # Every 4 seconds
-            self.special_attack_timer = 0
-            if self.phase == 2:
-                self.create_homing_missile(player)
-            else:  # Phase 3
-                self.create_laser_beam(player)
-                
-        # Update projectiles
-        for proj in self.projectiles[:]:
-            if proj['type'] == 'homing':
+        # Update projectiles and check collision with the players in a single pass,
+        # compacting the list in place and returning dead projectiles to the pool
+        players = self.players
+        hit_rect = self.hit_rect
+        projectiles = self.projectiles
+        alive = 0
+        for proj in projectiles:
+            if proj.type == 'homing':
                 # Homing missile behavior
-                dx = player.world_x - proj['x']
-                dy = player.y - proj['y']
+                dx = target.world_x - proj.x
+                dy = target.y - proj.y
                 distance = math.sqrt(dx*dx + dy*dy)
                 if distance > 0:
                     homing_strength = 0.3
-                    proj['dx'] += (dx / distance) * homing_strength
-                    proj['dy'] += (dy / distance) * homing_strength
+                    proj.dx += (dx / distance) * homing_strength
+                    proj.dy += (dy / distance) * homing_strength
                     # Limit speed
-                    speed = math.sqrt(proj['dx']**2 + proj['dy']**2)
+                    speed = math.sqrt(proj.dx**2 + proj.dy**2)
                     if speed > 6:
-                        proj['dx'] = (proj['dx'] / speed) * 6
-                        proj['dy'] = (proj['dy'] / speed) * 6
-            elif proj['type'] == 'laser':
-                # Laser beam - faster and straight
-                pass
-            
-            proj['x'] += proj['dx']
-            proj['y'] += proj['dy']
-            
-            # Remove if off screen or expired
-            if (proj['x'] < camera_x - 100 or proj['x'] > camera_x + SCREEN_WIDTH + 100 or 
-                proj['y'] < 0 or proj['y'] > SCREEN_HEIGHT):
-                self.projectiles.remove(proj)
-            elif 'lifetime' in proj:
-                proj['lifetime'] -= 1
-                if proj['lifetime'] <= 0:
-                    self.projectiles.remove(proj)
+                        proj.dx = (proj.dx / speed) * 6
+                        proj.dy = (proj.dy / speed) * 6
+            
+            proj.x += proj.dx
+            proj.y += proj.dy
+            
+            # Remove if out of the world or expired. Culling against the world rather
+            # than the camera means projectiles can't outlive a camera that stops moving
+            keep = True
+            if (proj.x < -100 or proj.x > WORLD_WIDTH + 100 or
+                proj.y < 0 or proj.y > SCREEN_HEIGHT):
+                keep = False
+            elif proj.lifetime is not None:
+                proj.lifetime -= 1
+                keep = proj.lifetime > 0
                 
-        # Check projectile collision with player
-        player_rect = player.get_world_rect()
-        for proj in self.projectiles[:]:
-            proj_size = 12 if proj['type'] == 'homing' else 8
-            proj_rect = pygame.Rect(proj['x'] - proj_size, proj['y'] - proj_size, proj_size*2, proj_size*2)
-            if player_rect.colliderect(proj_rect):
-                damage = 15 if proj['type'] == 'homing' else 12 if proj['type'] == 'laser' else 8
-                player.health -= damage
-                self.projectiles.remove(proj)
+            if keep:
+                proj_size = 12 if proj.type == 'homing' else 8
+                hit_rect.update(proj.x - proj_size, proj.y - proj_size, proj_size*2, proj_size*2)
+                for player in players:
+                    if player.health > 0 and player.get_world_rect().colliderect(hit_rect):
+                        damage = 15 if proj.type == 'homing' else 12 if proj.type == 'laser' else 8
+                        player.health -= damage
+                        self.telemetry.emit('projectile_hit', type=proj.type, x=player.world_x, y=player.y,
+                                            damage=damage, phase=self.phase)
+                        keep = False
+                        break
+                    
+            if keep:
+                projectiles[alive] = proj
+                alive += 1
+            else:
+                self.projectile_pool.append(proj)
+        del projectiles[alive:]
+    
+    def spawn_projectile(self, x, y, dx, dy, projectile_type, lifetime=None):
+        proj = self.projectile_pool.pop() if self.projectile_pool else Projectile()
+        proj.x = x
+        proj.y = y
+        proj.dx = dx
+        proj.dy = dy
+        proj.type = projectile_type
+        proj.lifetime = lifetime
+        self.projectiles.append(proj)
+        return proj
     
+    def start(self, players):
+        self.players = players
+        self.target = players[0]
+        self.attack_timer.resume()
+        
+    def stop(self):
+        for timer in self.timers:
+            timer.pause()
+            
+    def enter_phase(self, phase):
+        # Faster attacks in higher phases, keeping the time already waited
+        self.attack_timer.set_interval(self.attack_cooldown // phase)
+        if phase >= 2:
+            # Shields and special attacks from phase 2 on. The first special attack
+            # comes straight away: by now the fight has lasted longer than its interval
+            if not self.special_attack_timer.scheduled:
+                self.special_attack_timer.reschedule(1)
+                self.shield_timer.resume()
+        if phase == 2:
+            self.teleport_timer.resume()
+        else:
+            self.teleport_timer.pause()
+            
+    def attack(self):
+        if self.phase == 1:
+            self.create_single_projectile(self.target)
+        elif self.phase == 2:
+            self.create_triple_shot(self.target)
+        else:  # Phase 3
+            self.create_spread_shot(self.target)
+            
+    def special_attack(self):
+        if self.phase == 2:
+            self.create_homing_missile(self.target)
+        else:  # Phase 3
+            self.create_laser_beam(self.target)
+            
+    def teleport(self):
+        # Teleport to random position near player
+        self.world_x = self.target.world_x + random.randint(-200, 200)
+        self.world_x = max(WORLD_WIDTH - 400, min(self.world_x, WORLD_WIDTH - 50))
+        
+    def raise_shield(self):
+        self.shield_active = True
+        self.shield_off_timer.reschedule(180)
+        self.audio.play('shield')
+        
+    def lower_shield(self):
+        self.shield_active = False
+        
     def create_single_projectile(self, player):
         dx = player.world_x - self.world_x
         dy = player.y - self.y
@@ -276,15 +479,9 @@ class Alien:
             proj_speed = 5
             proj_dx = (dx / distance) * proj_speed
             proj_dy = (dy / distance) * proj_speed
-            
-            projectile = {
-                'x': self.world_x + self.width // 2,
-                'y': self.y + self.height // 2,
-                'dx': proj_dx,
-                'dy': proj_dy,
-                'type': 'normal'
-            }
-            self.projectiles.append(projectile)
+            self.spawn_projectile(self.world_x + self.width // 2, self.y + self.height // 2,
+                                  proj_dx, proj_dy, 'normal')
+            self.audio.play('shot')
     
     def create_triple_shot(self, player):
         # Create three projectiles in a spread pattern
@@ -295,50 +492,28 @@ class Alien:
             base_angle = math.atan2(dy, dx)
             proj_speed = 5
             
-            for i, angle_offset in enumerate([-0.3, 0, 0.3]):  # Spread angles
+            for angle_offset in TRIPLE_SHOT_ANGLES:  # Spread angles
                 angle = base_angle + angle_offset
                 proj_dx = math.cos(angle) * proj_speed
                 proj_dy = math.sin(angle) * proj_speed
-                
-                projectile = {
-                    'x': self.world_x + self.width // 2,
-                    'y': self.y + self.height // 2,
-                    'dx': proj_dx,
-                    'dy': proj_dy,
-                    'type': 'normal'
-                }
-                self.projectiles.append(projectile)
+                self.spawn_projectile(self.world_x + self.width // 2, self.y + self.height // 2,
+                                      proj_dx, proj_dy, 'normal')
+            self.audio.play('triple_shot')
     
     def create_spread_shot(self, player):
         # Create five projectiles in a wide spread (rage mode)
         center_x = self.world_x + self.width // 2
         center_y = self.y + self.height // 2
-        proj_speed = 6
         
-        for i in range(5):
-            angle = (i - 2) * 0.4  # Spread from -0.8 to 0.8 radians
-            proj_dx = math.cos(angle) * proj_speed
-            proj_dy = math.sin(angle) * proj_speed
-            
-            projectile = {
-                'x': center_x,
-                'y': center_y,
-                'dx': proj_dx,
-                'dy': proj_dy,
-                'type': 'normal'
-            }
-            self.projectiles.append(projectile)
+        for proj_dx, proj_dy in SPREAD_SHOT_VELOCITIES:
+            self.spawn_projectile(center_x, center_y, proj_dx, proj_dy, 'normal')
+        self.audio.play('spread_shot')
     
     def create_homing_missile(self, player):
-        # Special homing projectile
-        projectile = {
-            'x': self.world_x + self.width // 2,
-            'y': self.y + self.height // 2,
-            'dx': 2,
-            'dy': 2,
-            'type': 'homing'
-        }
-        self.projectiles.append(projectile)
+        # Special homing projectile - it can chase Wall-E forever, so it burns out
+        self.spawn_projectile(self.world_x + self.width // 2, self.y + self.height // 2, 2, 2, 'homing',
+                              lifetime=300)  # Lasts 5 seconds
+        self.audio.play('homing')
     
     def create_laser_beam(self, player):
         # Fast laser beam attack
@@ -349,72 +524,70 @@ class Alien:
             proj_speed = 8
             proj_dx = (dx / distance) * proj_speed
             proj_dy = (dy / distance) * proj_speed
-            
-            projectile = {
-                'x': self.world_x + self.width // 2,
-                'y': self.y + self.height // 2,
-                'dx': proj_dx,
-                'dy': proj_dy,
-                'type': 'laser',
-                'lifetime': 120  # Lasts 2 seconds
-            }
-            self.projectiles.append(projectile)
+            self.spawn_projectile(self.world_x + self.width // 2, self.y + self.height // 2,
+                                  proj_dx, proj_dy, 'laser', lifetime=120)  # Lasts 2 seconds
+            self.audio.play('laser')
                 
-    def draw(self, screen, camera_x):
+    def sort_projectiles(self):
+        # Once per frame, so each viewport can find the projectiles it shows by
+        # bisecting their xs, as obstacles are found through Game.obstacle_xs
+        projectiles = self.projectiles
+        projectiles.sort(key=projectile_x)
+        xs = self.projectile_xs
+        while len(xs) < len(projectiles):
+            xs.append(0.0)
+        for i in range(len(projectiles)):
+            xs[i] = projectiles[i].x
+        
+    def draw(self, render, camera_x, width=SCREEN_WIDTH):
+        sprites = self.sprites or self.load_sprites()
+        blit_rect = self.blit_rect
+        self.x = self.world_x - camera_x
+        
         # Only draw if on screen
         if -100 <= self.x <= SCREEN_WIDTH + 100:
             # Draw shield effect if active
             if self.shield_active:
-                shield_color = (0, 255, 255, 100)  # Cyan with transparency
-                shield_surface = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-                pygame.draw.ellipse(shield_surface, shield_color, (0, 0, self.width + 20, self.height + 20))
-                screen.blit(shield_surface, (self.x - 10, self.y - 10))
+                blit_rect.x = self.x - 10
+                blit_rect.y = self.y - 10
+                render.blit(LAYER_ACTORS, self.shield_sprite, blit_rect)
             
             # Change alien color based on phase
             if self.phase == 1:
-                alien_color = GREEN
+                sprite = sprites[0]
             elif self.phase == 2:
-                alien_color = (255, 165, 0)  # Orange
-            else:  # Phase 3 - rage mode
-                alien_color = (255, 0, 0) if pygame.time.get_ticks() % 200 < 100 else (255, 100, 100)  # Flashing red
-            
-            # Draw alien with phase-appropriate color
-            pygame.draw.ellipse(screen, alien_color, (self.x, self.y, self.width, self.height))
-            
-            # Eyes - more menacing in higher phases
-            eye_color = RED if self.phase < 3 else (255, 255, 0)  # Yellow eyes in rage mode
-            pygame.draw.circle(screen, eye_color, (self.x + 15, self.y + 20), 8)
-            pygame.draw.circle(screen, eye_color, (self.x + 45, self.y + 20), 8)
-            
-            # Add spikes/details for higher phases
-            if self.phase >= 2:
-                # Draw spikes
-                for i in range(3):
-                    spike_x = self.x + 10 + i * 20
-                    spike_y = self.y - 5
-                    pygame.draw.polygon(screen, BLACK, [(spike_x, spike_y), (spike_x + 5, spike_y - 10), (spike_x + 10, spike_y)])
-        
-        # Draw projectiles with different colors based on type
-        for proj in self.projectiles:
-            proj_screen_x = proj['x'] - camera_x
-            if -20 <= proj_screen_x <= SCREEN_WIDTH + 20:
-                if proj['type'] == 'homing':
-                    # Homing missiles are larger and red
-                    pygame.draw.circle(screen, RED, (int(proj_screen_x), int(proj['y'])), 12)
-                    pygame.draw.circle(screen, YELLOW, (int(proj_screen_x), int(proj['y'])), 6)
-                elif proj['type'] == 'laser':
-                    # Laser beams are bright and elongated
-                    pygame.draw.circle(screen, WHITE, (int(proj_screen_x), int(proj['y'])), 6)
-                    pygame.draw.circle(screen, CYAN, (int(proj_screen_x), int(proj['y'])), 3)
-                else:
-                    # Normal projectiles
-                    pygame.draw.circle(screen, PURPLE, (int(proj_screen_x), int(proj['y'])), 8)
+                sprite = sprites[1]
+            else:  # Phase 3 - rage mode, flashing red
+                sprite = sprites[2] if pygame.time.get_ticks() % 200 < 100 else sprites[3]
+            blit_rect.x = self.x
+            blit_rect.y = self.y - 15
+            render.blit(LAYER_ACTORS, sprite, blit_rect)
+        
+        # Draw projectiles with different colors based on type. They're sorted
+        # by x, so only the ones inside this view are visited
+        projectile_sprites = self.projectile_sprites
+        projectiles = self.projectiles
+        xs = self.projectile_xs
+        first = bisect_left(xs, camera_x - 20, 0, len(projectiles))
+        last = bisect_right(xs, camera_x + width + 20, first, len(projectiles))
+        for i in range(first, last):
+            proj = projectiles[i]
+            sprite, radius = projectile_sprites[proj.type]
+            blit_rect.x = int(proj.x - camera_x) - radius
+            blit_rect.y = int(proj.y) - radius
+            render.blit(LAYER_PROJECTILES, sprite, blit_rect)
             
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        rect = self.rect
+        rect.x = self.x
+        rect.y = self.y
+        return rect
     
     def get_world_rect(self):
-        return pygame.Rect(self.world_x, self.y, self.width, self.height)
+        rect = self.world_rect
+        rect.x = self.world_x
+        rect.y = self.y
+        return rect
     
     def take_damage(self, damage):
         # Shield blocks damage
@@ -422,57 +595,580 @@ class Alien:
             self.health -= damage
         else:
             # Visual feedback that shield blocked the attack
-            pass
+            self.telemetry.emit('shield_block', damage=damage, phase=self.phase)
 
 class EVE:
-    def __init__(self, x, y):
+    sprite = None  # Glow, body and heart drawn once into a single sprite
+    
+    def __init__(self, x, y, scheduler):
         self.world_x = x
         self.y = y
         self.width = 35
         self.height = 50
         self.rescued = False
         self.x = 0  # Screen position
-        self.float_timer = 0
+        self.scheduler = scheduler  # Drives the floating animation
+        self.float_start = None  # Tick before EVE's first update; the float starts from there
+        self.rect = pygame.Rect(0, y, self.width, self.height)
+        self.world_rect = pygame.Rect(x, y, self.width, self.height)
+        self.blit_rect = pygame.Rect(0, 0, 0, 0)
         
-    def update(self):
-        self.float_timer += 1
-        # Floating animation
-        self.y += math.sin(self.float_timer * 0.05) * 1
-        
-    def draw(self, screen, camera_x):
-        self.x = self.world_x - camera_x
-        # Only draw if on screen
-        if -50 <= self.x <= SCREEN_WIDTH + 50:
-            # Draw EVE as a sleek white robot with glow effect
-            # Glow effect
+    @classmethod
+    def load_sprite(cls):
+        if cls.sprite is None:
+            # The glow reaches 4px past the body and the heart sits 23px above it
+            width, height = 35, 50
+            sprite = make_sprite(width + 8, height + 27)
             for i in range(3):
                 glow_alpha = 50 - i * 15
-                glow_surface = pygame.Surface((self.width + i*4, self.height + i*4), pygame.SRCALPHA)
-                pygame.draw.ellipse(glow_surface, (*WHITE, glow_alpha), (0, 0, self.width + i*4, self.height + i*4))
-                screen.blit(glow_surface, (self.x - i*2, self.y - i*2))
+                glow_surface = make_sprite(width + i*4, height + i*4)
+                pygame.draw.ellipse(glow_surface, (*WHITE, glow_alpha), (0, 0, width + i*4, height + i*4))
+                sprite.blit(glow_surface, (4 - i*2, 23 - i*2))
             
-            pygame.draw.ellipse(screen, WHITE, (self.x, self.y, self.width, self.height))
-            pygame.draw.circle(screen, BLUE, (self.x + 10, self.y + 15), 4)  # Eyes
-            pygame.draw.circle(screen, BLUE, (self.x + 25, self.y + 15), 4)
+            pygame.draw.ellipse(sprite, WHITE, (4, 23, width, height))
+            pygame.draw.circle(sprite, BLUE, (14, 38), 4)  # Eyes
+            pygame.draw.circle(sprite, BLUE, (29, 38), 4)
             
             # Heart symbol to show she needs rescue
-            heart_x, heart_y = self.x + self.width//2 - 5, self.y - 20
-            pygame.draw.circle(screen, RED, (heart_x, heart_y), 3)
-            pygame.draw.circle(screen, RED, (heart_x + 6, heart_y), 3)
-            pygame.draw.polygon(screen, RED, [(heart_x - 3, heart_y + 2), (heart_x + 9, heart_y + 2), (heart_x + 3, heart_y + 8)])
+            heart_x, heart_y = 4 + width//2 - 5, 3
+            pygame.draw.circle(sprite, RED, (heart_x, heart_y), 3)
+            pygame.draw.circle(sprite, RED, (heart_x + 6, heart_y), 3)
+            pygame.draw.polygon(sprite, RED, [(heart_x - 3, heart_y + 2), (heart_x + 9, heart_y + 2), (heart_x + 3, heart_y + 8)])
+            cls.sprite = sprite
+        return cls.sprite
+        
+    def update(self):
+        # Floating animation, timed from the first update so the intro's length
+        # doesn't shift EVE's hover band
+        now = self.scheduler.now
+        if self.float_start is None:
+            self.float_start = now - 1
+        self.y += math.sin((now - self.float_start) * 0.05) * 1
+        
+    def draw(self, render, camera_x):
+        self.x = self.world_x - camera_x
+        # Only draw if on screen
+        if -50 <= self.x <= SCREEN_WIDTH + 50:
+            blit_rect = self.blit_rect
+            blit_rect.x = self.x - 4
+            blit_rect.y = self.y - 23
+            render.blit(LAYER_ACTORS, self.sprite or self.load_sprite(), blit_rect)
         
     def get_rect(self):
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        rect = self.rect
+        rect.x = self.x
+        rect.y = self.y
+        return rect
     
     def get_world_rect(self):
-        return pygame.Rect(self.world_x, self.y, self.width, self.height)
+        rect = self.world_rect
+        rect.x = self.world_x
+        rect.y = self.y
+        return rect
+
+STORY_LINES = (
+    "In a distant galaxy, Wall-E and Eva lived peacefully...",
+    "One day, a mysterious alien ship appeared in the sky.",
+    "The alien abducted Eva while Wall-E was away collecting scrap!",
+    "Now Wall-E must brave dangerous obstacles to rescue her.",
+    "The journey is long and filled with deadly traps:",
+    "Fire pits, acid pools, laser beams, and spike traps await!",
+    "Help Wall-E overcome all obstacles to save Eva!",
+    "Press SPACE to begin the rescue mission!",
+    "Press S to SKIP intro"
+)
+
+PLAY_INSTRUCTIONS = (
+    "Arrow Keys/WASD: Move",
+    "Space/Up: Jump",
+    "Avoid obstacles and reach Eva!"
+)
+
+# Enhanced instructions based on boss phase
+BOSS_INSTRUCTIONS = {
+    1: ("Touch the alien to attack!",
+        "Avoid purple projectiles!"),
+    2: ("Phase 2: Triple shots & homing missiles!",
+        "Watch out for teleportation and shields!"),
+    3: ("RAGE MODE: Spread shots & laser beams!",
+        "Maximum difficulty - stay mobile!"),
+}
+
+class CachedText:
+    # A line of HUD text that is only re-rendered when its value changes
+    def __init__(self, font, template, color):
+        self.font = font
+        self.template = template
+        self.color = color
+        self.value = None
+        self.surface = None
+        
+    def get(self, value):
+        if value != self.value or self.surface is None:
+            self.value = value
+            self.surface = self.font.render(self.template.format(value), True, self.color)
+        return self.surface
+
+def render_centered(font, text, color, center):
+    surface = font.render(text, True, color)
+    return surface, surface.get_rect(center=center)
+
+class Scene:
+    # One scene per GameState. Game.change_state() calls exit() on the old scene
+    # and enter() on the new one; load() builds the scene's text and sprites and
+    # runs once, when the game prewarms every scene at startup. Each frame,
+    # draw_viewport() draws the world once per viewport and draw() whatever
+    # spans the whole screen.
+    def __init__(self, game):
+        self.game = game
+        self.loaded = False
+        
+    def prewarm(self):
+        if not self.loaded:
+            self.load()
+            self.loaded = True
+            
+    def load(self):
+        pass
+        
+    def enter(self):
+        pass
+        
+    def exit(self):
+        pass
+        
+    def handle_event(self, event):
+        pass
+        
+    def update(self):
+        pass
+        
+    def cull(self):
+        # Per-frame work shared by every viewport, done before any of them draws
+        pass
+        
+    def draw_viewport(self, viewport):
+        pass
+        
+    def draw(self, render):
+        pass
+
+class IntroScene(Scene):
+    def load(self):
+        game = self.game
+        self.title = render_centered(game.large_font, "WALL-E'S RESCUE MISSION", YELLOW, (SCREEN_WIDTH // 2, 100))
+        self.lines = []
+        for i, line in enumerate(STORY_LINES):
+            color = WHITE if i < len(STORY_LINES) - 2 else YELLOW
+            self.lines.append(render_centered(game.small_font, line, color, (SCREEN_WIDTH // 2, 200 + i * 35)))
+            
+    def enter(self):
+        # Story variables
+        self.game.story_phase = 0
+        self.story_timer = self.game.scheduler.every(90, self.advance_story)  # 1.5 seconds at 60 FPS
+        
+    def exit(self):
+        self.story_timer.cancel()
+        
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                if self.game.story_phase >= 7:  # All story shown
+                    self.game.change_state(GameState.PLAYING)
+            elif event.key == pygame.K_s:
+                self.game.change_state(GameState.PLAYING)  # Skip intro
+                
+    def advance_story(self):
+        # Auto-advance story
+        game = self.game
+        game.story_phase += 1
+        if game.story_phase >= len(STORY_LINES) - 1:
+            self.story_timer.cancel()
+            
+    def draw(self, render):
+        story_phase = self.game.story_phase
+        
+        # Use space background
+        render.blit(LAYER_BACKGROUND, self.game.space_bg, (0, 0))
+        
+        # Add twinkling effect to stars
+        for _ in range(20):
+            x = random.randint(0, SCREEN_WIDTH)
+            y = random.randint(0, SCREEN_HEIGHT)
+            if random.random() < 0.1:  # 10% chance to twinkle
+                render.draw(LAYER_BACKGROUND, pygame.draw.circle, WHITE, (x, y), 2)
+        
+        # Title
+        render.blit(LAYER_HUD, *self.title)
+        
+        phase = min(story_phase, len(self.lines) - 1)
+        for text, text_rect in self.lines[:phase + 1]:
+            render.blit(LAYER_HUD, text, text_rect)
+        
+        # Show Wall-E and Eva in intro, over the story text as before
+        if story_phase >= 2:
+            # Wall-E
+            render.fill(LAYER_HUD, GRAY, (200, 500, 40, 40))
+            render.fill(LAYER_HUD, YELLOW, (205, 505, 10, 10))
+            render.fill(LAYER_HUD, YELLOW, (225, 505, 10, 10))
+            
+            # Eva (being abducted)
+            eva_y = 400 - min(story_phase * 10, 100)
+            render.draw(LAYER_HUD, pygame.draw.ellipse, WHITE, (700, eva_y, 35, 50))
+            render.draw(LAYER_HUD, pygame.draw.circle, BLUE, (710, eva_y + 15), 3)
+            render.draw(LAYER_HUD, pygame.draw.circle, BLUE, (725, eva_y + 15), 3)
+            
+            # Alien ship
+            if story_phase >= 3:
+                ship_y = eva_y - 50
+                render.draw(LAYER_HUD, pygame.draw.ellipse, GREEN, (680, ship_y, 80, 30))
+                render.draw(LAYER_HUD, pygame.draw.circle, RED, (720, ship_y + 15), 5)
+
+class PlayingScene(Scene):
+    def load(self):
+        self.instructions = []
+        for i, instruction in enumerate(PLAY_INSTRUCTIONS):
+            text = self.game.small_font.render(instruction, True, WHITE)
+            self.instructions.append((text, text.get_rect(topleft=(SCREEN_WIDTH - 250, 10 + i * 25))))
+        Player.load_sprite()
+        EVE.load_sprite()
+        
+    def enter(self):
+        # Obstacle types are random per run, so make sure each one's sprite exists up front
+        for obstacle in self.game.obstacles:
+            obstacle.sprite = Obstacle.load_sprite(obstacle.type, obstacle.width, obstacle.height)
+        self.game.start_run()
+            
+    def update(self):
+        game = self.game
+        keys = game.key_source()
+        reached_eve = False
+        for player in game.players:
+            if player.health > 0:
+                player.update(game.obstacles, keys)
+                # Check if player reached EVE (boss fight)
+                if player.world_x >= WORLD_WIDTH - 200:
+                    reached_eve = True
+        game.eve.update()
+        
+        game.update_camera()
+            
+        if reached_eve:
+            game.change_state(GameState.BOSS_FIGHT)
+            
+        # Check game over
+        if not game.players_alive():
+            game.player_died()
+            
+    def draw_viewport(self, viewport):
+        game = self.game
+        render = viewport.render
+        camera_x = viewport.camera_x
+        viewport.draw_background()
+        viewport.draw_ground()
+        
+        # Draw obstacles; they're sorted by x, so only the ones in view are visited
+        obstacles = game.obstacles
+        for i in range(*game.obstacles_between(camera_x - 100, camera_x + viewport.width + 100)):
+            obstacles[i].draw(render, camera_x)
+            
+        # Draw characters
+        for player in game.players:
+            if player.health > 0:
+                player.draw(render, camera_x)
+        
+        # Only show Eva when close
+        if viewport.player.world_x >= WORLD_WIDTH - 300:
+            game.eve.draw(render, camera_x)
+        
+        viewport.draw_hud()
+        
+    def draw(self, render):
+        # The instructions only list the single-player controls
+        if len(self.game.viewports) == 1:
+            for text, text_rect in self.instructions:
+                render.blit(LAYER_HUD, text, text_rect)
+
+class BossFightScene(Scene):
+    def load(self):
+        game = self.game
+        
+        # Boss phase indicator, keyed by (phase, rage mode)
+        self.titles = {}
+        for phase in (1, 2, 3):
+            for rage_mode in (False, True):
+                phase_text = f"ALIEN BOSS - PHASE {phase}"
+                if rage_mode:
+                    phase_text += " (RAGE MODE!)"
+                self.titles[phase, rage_mode] = render_centered(game.font, phase_text, WHITE, (SCREEN_WIDTH // 2, 25))
+        
+        self.shield_text = render_centered(game.small_font, "SHIELD ACTIVE!", CYAN, (SCREEN_WIDTH // 2, 85))
+        
+        self.instructions = {}
+        for phase, lines in BOSS_INSTRUCTIONS.items():
+            color = WHITE if phase == 1 else YELLOW if phase == 2 else RED
+            self.instructions[phase] = [
+                render_centered(game.small_font, instruction, color, (SCREEN_WIDTH // 2, 110 + i * 25))
+                for i, instruction in enumerate(lines)
+            ]
+            
+        self.health_bar_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 50, 400, 25)
+        self.health_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 50, 400, 25)
+        
+        # Draw every phase of the alien and its effects once so none of them is
+        # drawn for the first time in the middle of the fight
+        for sprite in Alien.load_sprites():
+            game.screen.blit(sprite, (0, 0))
+        game.screen.blit(Alien.shield_sprite, (0, 0))
+        for sprite, radius in Alien.projectile_sprites.values():
+            game.screen.blit(sprite, (0, 0))
+            
+    def enter(self):
+        game = self.game
+        game.telemetry.emit('boss_start', duration=game.run_duration())
+        game.alien.start(game.players)
+        
+    def exit(self):
+        self.game.alien.stop()
+        
+    def update(self):
+        game = self.game
+        keys = game.key_source()
+        for player in game.players:
+            if player.health > 0:
+                player.update((), keys)  # No obstacles during boss fight
+        game.alien.update()
+        game.eve.update()
+        
+        game.update_camera()
+        
+        # Check if player can attack alien (simple collision)
+        alien_rect = game.alien.get_world_rect()
+        for player in game.players:
+            if player.health > 0 and player.get_world_rect().colliderect(alien_rect):
+                game.alien.take_damage(3)  # Increased damage to compensate for higher health
+            
+        # Check game over
+        if not game.players_alive():
+            game.player_died()
+            
+        # Check victory
+        elif game.alien.health <= 0:
+            game.telemetry.emit('victory', duration=game.run_duration(), health=game.player.health)
+            game.end_run('victory')
+            game.change_state(GameState.VICTORY)
+            
+    def cull(self):
+        self.game.alien.sort_projectiles()
+        
+    def draw_viewport(self, viewport):
+        game = self.game
+        render = viewport.render
+        camera_x = viewport.camera_x
+        viewport.draw_background()
+        viewport.draw_ground()
+        
+        # Draw characters
+        for player in game.players:
+            if player.health > 0:
+                player.draw(render, camera_x)
+        game.eve.draw(render, camera_x)
+        game.alien.draw(render, camera_x, viewport.width)
+        
+        viewport.draw_hud()
+        
+    def draw(self, render):
+        # The boss HUD is drawn once, across the top of the screen
+        alien = self.game.alien
+        
+        # Boss health bar background
+        render.fill(LAYER_HUD, RED, self.health_bar_rect)
+        
+        # Health bar color changes based on phase
+        if alien.phase == 1:
+            health_color = GREEN
+        elif alien.phase == 2:
+            health_color = ORANGE
+        else:
+            health_color = RED
+        
+        self.health_rect.width = (alien.health / alien.max_health) * self.health_bar_rect.width
+        render.fill(LAYER_HUD, health_color, self.health_rect)
+        
+        # Boss phase indicator
+        text, text_rect = self.titles[alien.phase, alien.rage_mode]
+        render.blit(LAYER_HUD, text, text_rect)
+        
+        # Shield indicator
+        if alien.shield_active:
+            text, text_rect = self.shield_text
+            render.blit(LAYER_HUD, text, text_rect)
+        
+        for text, text_rect in self.instructions[alien.phase]:
+            render.blit(LAYER_HUD, text, text_rect)
+
+class GameOverScene(Scene):
+    def load(self):
+        # Nothing on this screen moves, so it is rendered once
+        game = self.game
+        self.backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.backdrop.fill(BLACK)
+        self.backdrop.blit(*render_centered(game.large_font, "MISSION FAILED", RED,
+                                            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)))
+        self.backdrop.blit(*render_centered(game.font, "Wall-E couldn't save Eva...", WHITE,
+                                            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
+        self.backdrop.blit(*render_centered(game.small_font, "Press R to restart the rescue mission", YELLOW,
+                                            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50)))
+        
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+            # Restart game
+            self.game.reset()
+            
+    def draw(self, render):
+        render.blit(LAYER_BACKGROUND, self.backdrop, (0, 0))
+
+class VictoryScene(Scene):
+    def load(self):
+        game = self.game
+        backdrop = self.backdrop = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        backdrop.fill(BLACK)
+        
+        # Victory animation
+        backdrop.blit(*render_centered(game.large_font, "MISSION ACCOMPLISHED!", GREEN,
+                                       (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)))
+        backdrop.blit(*render_centered(game.font, "Eva has been rescued!", WHITE,
+                                       (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50)))
+        
+        # Draw happy Wall-E and Eva
+        pygame.draw.rect(backdrop, GRAY, (SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2, 40, 40))
+        pygame.draw.rect(backdrop, YELLOW, (SCREEN_WIDTH // 2 - 55, SCREEN_HEIGHT // 2 + 5, 10, 10))
+        pygame.draw.rect(backdrop, YELLOW, (SCREEN_WIDTH // 2 - 35, SCREEN_HEIGHT // 2 + 5, 10, 10))
+        
+        pygame.draw.ellipse(backdrop, WHITE, (SCREEN_WIDTH // 2 + 20, SCREEN_HEIGHT // 2 - 5, 35, 50))
+        pygame.draw.circle(backdrop, BLUE, (SCREEN_WIDTH // 2 + 30, SCREEN_HEIGHT // 2 + 10), 4)
+        pygame.draw.circle(backdrop, BLUE, (SCREEN_WIDTH // 2 + 45, SCREEN_HEIGHT // 2 + 10), 4)
+        
+        backdrop.blit(*render_centered(game.small_font, "Press R to play again", YELLOW,
+                                       (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100)))
+        
+        # Heart drawn once; its top-left sits 3px up and left of the first lobe's centre
+        self.heart = make_sprite(13, 12)
+        pygame.draw.circle(self.heart, RED, (3, 3), 3)
+        pygame.draw.circle(self.heart, RED, (9, 3), 3)
+        pygame.draw.polygon(self.heart, RED, [(0, 5), (12, 5), (6, 11)])
+        self.heart_rect = self.heart.get_rect()
+        
+    def enter(self):
+        self.game.audio.play('victory')
+        
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+            # Restart game
+            self.game.reset()
+            
+    def draw(self, render):
+        render.blit(LAYER_BACKGROUND, self.backdrop, (0, 0))
+        
+        # Hearts
+        heart_rect = self.heart_rect
+        for i in range(5):
+            heart_rect.x = SCREEN_WIDTH // 2 - 53 + i * 20
+            heart_rect.y = SCREEN_HEIGHT // 2 - 33 + math.sin(pygame.time.get_ticks() * 0.01 + i) * 5
+            render.blit(LAYER_HUD, self.heart, heart_rect)
+
+class Viewport:
+    # One player's camera onto the shared world, drawn into its own part of the
+    # screen. Viewports shorter than the screen show its bottom rows, where the
+    # action is, and keep the HUD on the ground strip.
+    def __init__(self, game, rect, label=""):
+        self.game = game
+        self.rect = pygame.Rect(rect)
+        self.width = self.rect.width
+        self.height = self.rect.height
+        if self.rect.size == game.screen.get_size():
+            self.surface = game.screen
+        else:
+            self.surface = game.screen.subsurface(self.rect)
+        self.offset_y = self.height - SCREEN_HEIGHT  # Shifts world rows into a short viewport
+        self.render = RenderBuffer()
+        self.player = None
+        self.camera_x = 0
+        
+        # HUD text cached per viewport, since each one shows a different player
+        self.health_text = CachedText(game.small_font, label + "Health: {}/100", WHITE)
+        self.progress_text = CachedText(game.small_font, "Progress: {:.1f}%", WHITE)
+        self.distance_text = CachedText(game.small_font, "Distance to Eva: {}m", YELLOW)
+        
+        # Reusable HUD rects so the steady-state frame doesn't allocate them
+        hud_y = 10 if self.height == SCREEN_HEIGHT and self.width == SCREEN_WIDTH else self.height - 95
+        self.hud_y = hud_y
+        self.health_bar_rect = pygame.Rect(10, hud_y, 200, 20)
+        self.health_rect = pygame.Rect(10, hud_y, 200, 20)
+        self.ground_rect = pygame.Rect(0, SCREEN_HEIGHT - 100, 100, 100)
+        self.bg_rect = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+    def follow(self):
+        # Camera follows player but with some offset
+        target_x = self.player.world_x - self.width // 3
+        self.camera_x += (target_x - self.camera_x) * 0.1  # Smooth camera movement
+        self.camera_x = max(0, min(self.camera_x, WORLD_WIDTH - self.width))
+        
+    def draw_hud(self):
+        render = self.render
+        player = self.player
+        hud_y = self.hud_y
+        
+        # Health bar background
+        render.fill(LAYER_HUD, RED, self.health_bar_rect)
+        
+        # Health
+        self.health_rect.width = (player.health / player.max_health) * self.health_bar_rect.width
+        render.fill(LAYER_HUD, GREEN, self.health_rect)
+        
+        # Health text
+        render.blit(LAYER_HUD, self.health_text.get(int(player.health)), (10, hud_y + 25))
+        
+        # Progress bar
+        progress = (player.world_x / WORLD_WIDTH) * 100
+        render.blit(LAYER_HUD, self.progress_text.get(round(progress, 1)), (10, hud_y + 50))
+        
+        # Distance to Eva
+        distance_to_eva = max(0, self.game.eve.world_x - player.world_x)
+        if distance_to_eva > 0:
+            render.blit(LAYER_HUD, self.distance_text.get(int(distance_to_eva)), (10, hud_y + 75))
+        else:
+            render.blit(LAYER_HUD, self.game.rescue_text, (10, hud_y + 75))
+                
+    def draw_background(self):
+        # Parallax scrolling background; every viewport blits the same surface
+        space_bg = self.game.space_bg
+        bg_x = -(self.camera_x * 0.5) % SCREEN_WIDTH
+        bg_rect = self.bg_rect
+        if bg_x < self.width:
+            bg_rect.x = bg_x
+            self.render.blit(LAYER_BACKGROUND, space_bg, bg_rect)
+        if bg_x > 0:
+            bg_rect.x = bg_x - SCREEN_WIDTH
+            self.render.blit(LAYER_BACKGROUND, space_bg, bg_rect)
+            
+    def draw_ground(self):
+        ground_rect = self.ground_rect
+        ground_start = -self.camera_x % 100 - 100  # One tile early, so the left edge is never bare
+        for x in range(int(ground_start), self.width + 100, 100):
+            ground_rect.x = x
+            self.render.fill(LAYER_GROUND, BROWN, ground_rect)  # The backend merges these into one fill
 
 class Game:
-    def __init__(self):
+    def __init__(self, telemetry=NULL_TELEMETRY, audio=None, players=1):
+        # Only the subsystems the game uses are started: the mixer starts with
+        # the audio, and SDL's timer with the first clock tick
+        pygame.display.init()
+        pygame.font.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Wall-E and Eva - Extended Rescue Mission")
         self.clock = pygame.time.Clock()
-        self.state = GameState.INTRO
+        self.clock.tick()  # Run timings read pygame.time.get_ticks(), which needs the timer
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.large_font = pygame.font.Font(None, 48)
@@ -490,22 +1186,90 @@ class Game:
                 y = random.randint(0, SCREEN_HEIGHT)
                 pygame.draw.circle(self.space_bg, WHITE, (x, y), 1)
         
-        # Game objects
-        self.player = Player(50, SCREEN_HEIGHT - 150)
-        self.eve = EVE(WORLD_WIDTH - 150, SCREEN_HEIGHT - 200)
-        self.alien = Alien(WORLD_WIDTH - 200, SCREEN_HEIGHT - 230)
+        self.rescue_text = self.small_font.render("Eva is near! Defeat the alien!", True, RED)
+        
+        # One viewport per player (1, 2 or 4), all looking at the same world
+        self.controls = (SOLO_CONTROLS,) if players == 1 else SPLIT_CONTROLS[:players]
+        label = "" if players == 1 else "P{} "
+        self.viewports = [Viewport(self, rect, label.format(i + 1))
+                          for i, rect in enumerate(SPLIT_LAYOUTS[players])]
+        
+        # Scenes record their drawing into render buffers - one per viewport and
+        # one for the whole screen - which the backend executes once per frame;
+        # tools can swap in NULL_BACKEND
+        self.render = RenderBuffer()
+        self.render_backend = PygameBackend()
+        
+        # Input and pacing can be swapped out by tools that drive the game headless
+        self.key_source = pygame.key.get_pressed
+        self.fps = FPS
+        self.pacer = ClockPacer(self.clock)
+        self.latency = NULL_LATENCY
+        
+        self.telemetry = telemetry
+        # Sound samples are decoded up front, with the rest of the assets
+        self.audio = create_audio() if audio is None else audio
+        self.scenes = {
+            GameState.INTRO: IntroScene(self),
+            GameState.PLAYING: PlayingScene(self),
+            GameState.BOSS_FIGHT: BossFightScene(self),
+            GameState.GAME_OVER: GameOverScene(self),
+            GameState.VICTORY: VictoryScene(self),
+        }
+        self.scene = None
+        self.state = None
+        self.reset()
+        self.prewarm()
+        
+    def prewarm(self):
+        # Load every scene and draw each one once before the first real frame,
+        # so no transition pays for first-time rendering
+        for scene in self.scenes.values():
+            scene.prewarm()
+        for state, scene in self.scenes.items():
+            if state != GameState.INTRO:
+                self.record(scene)
+                self.submit(self.render_backend)
+        self.record(self.scene)
+        self.submit(self.render_backend)
+        
+    def change_state(self, state):
+        if self.scene is not None:
+            self.scene.exit()
+        self.state = state
+        self.scene = self.scenes[state]
+        self.scene.prewarm()
+        self.scene.enter()
+        
+    def reset(self):
+        # Start a fresh run without reopening the window or reloading assets.
+        # The run itself starts when play does; see start_run().
+        self.run_start_ticks = pygame.time.get_ticks()
+        self.run_started = False
+        
+        # Cooldowns and animations are registered with the scheduler, which the
+        # game ticks once per frame
+        self.scheduler = Scheduler()
+        
+        # Game objects; self.player is player one
+        self.players = [Player(50 + i * 50, SCREEN_HEIGHT - 150, self.telemetry, self.audio, controls)
+                        for i, controls in enumerate(self.controls)]
+        self.player = self.players[0]
+        self.eve = EVE(WORLD_WIDTH - 150, SCREEN_HEIGHT - 200, self.scheduler)
+        self.alien = Alien(WORLD_WIDTH - 200, SCREEN_HEIGHT - 230, self.scheduler, self.telemetry, self.audio)
         
         # Camera system
-        self.camera_x = 0
+        for viewport, player in zip(self.viewports, self.players):
+            viewport.player = player
+            viewport.camera_x = 0
         
-        # Create obstacles
+        # Create obstacles, sorted by x so viewports can cull them by bisection
         self.obstacles = []
         self.create_obstacles()
+        self.obstacles.sort(key=attrgetter('world_x'))
+        self.obstacle_xs = [obstacle.world_x for obstacle in self.obstacles]
         
-        # Story variables
-        self.intro_timer = 0
-        self.story_phase = 0
-        self.skip_intro = False
+        self.change_state(GameState.INTRO)
         
     def create_obstacles(self):
         # Simplified obstacle course with much wider spacing
@@ -538,329 +1302,123 @@ class Game:
             y = SCREEN_HEIGHT - 100 - height
             self.obstacles.append(Obstacle(x, y, width, height, obstacle_type))
     
-    def update_camera(self):
-        # Camera follows player but with some offset
-        target_x = self.player.world_x - SCREEN_WIDTH // 3
-        self.camera_x += (target_x - self.camera_x) * 0.1  # Smooth camera movement
-        self.camera_x = max(0, min(self.camera_x, WORLD_WIDTH - SCREEN_WIDTH))
+    def obstacles_between(self, left, right):
+        # Index range of the obstacles whose x lies in [left, right]
+        return bisect_left(self.obstacle_xs, left), bisect_right(self.obstacle_xs, right)
         
-    def draw_intro(self):
-        # Use space background
-        self.screen.blit(self.space_bg, (0, 0))
+    def players_alive(self):
+        alive = 0
+        for player in self.players:
+            if player.health > 0:
+                alive += 1
+        return alive
         
-        # Add twinkling effect to stars
-        for _ in range(20):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            if random.random() < 0.1:  # 10% chance to twinkle
-                pygame.draw.circle(self.screen, WHITE, (x, y), 2)
-        
-        story_lines = [
-            "In a distant galaxy, Wall-E and Eva lived peacefully...",
-            "One day, a mysterious alien ship appeared in the sky.",
-            "The alien abducted Eva while Wall-E was away collecting scrap!",
-            "Now Wall-E must brave dangerous obstacles to rescue her.",
-            "The journey is long and filled with deadly traps:",
-            "Fire pits, acid pools, laser beams, and spike traps await!",
-            "Help Wall-E overcome all obstacles to save Eva!",
-            "Press SPACE to begin the rescue mission!",
-            "Press S to SKIP intro"
-        ]
-        
-        phase = min(self.story_phase, len(story_lines) - 1)
+    def start_run(self):
+        # Called when PLAYING begins, so durations leave out the story screen
+        self.run_start_ticks = pygame.time.get_ticks()
+        self.run_started = True
+        self.telemetry.emit('run_start')
         
-        # Title
-        title_text = self.large_font.render("WALL-E'S RESCUE MISSION", True, YELLOW)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
-        self.screen.blit(title_text, title_rect)
-        
-        for i in range(phase + 1):
-            if i < len(story_lines):
-                color = WHITE if i < len(story_lines) - 2 else YELLOW
-                text = self.small_font.render(story_lines[i], True, color)
-                text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 200 + i * 35))
-                self.screen.blit(text, text_rect)
-        
-        # Show Wall-E and Eva in intro
-        if self.story_phase >= 2:
-            # Wall-E
-            pygame.draw.rect(self.screen, GRAY, (200, 500, 40, 40))
-            pygame.draw.rect(self.screen, YELLOW, (205, 505, 10, 10))
-            pygame.draw.rect(self.screen, YELLOW, (225, 505, 10, 10))
-            
-            # Eva (being abducted)
-            eva_y = 400 - min(self.story_phase * 10, 100)
-            pygame.draw.ellipse(self.screen, WHITE, (700, eva_y, 35, 50))
-            pygame.draw.circle(self.screen, BLUE, (710, eva_y + 15), 3)
-            pygame.draw.circle(self.screen, BLUE, (725, eva_y + 15), 3)
+    def run_duration(self):
+        return (pygame.time.get_ticks() - self.run_start_ticks) / 1000
+        
+    def end_run(self, outcome):
+        self.telemetry.emit('run_end', outcome=outcome, duration=self.run_duration())
+        
+    def player_died(self):
+        phase = self.alien.phase if self.state == GameState.BOSS_FIGHT else 0
+        self.telemetry.emit('death', phase=phase, x=self.player.world_x, y=self.player.y,
+                            duration=self.run_duration())
+        self.end_run('death')
+        self.change_state(GameState.GAME_OVER)
+        
+    def update_camera(self):
+        for viewport in self.viewports:
+            viewport.follow()
             
-            # Alien ship
-            if self.story_phase >= 3:
-                ship_y = eva_y - 50
-                pygame.draw.ellipse(self.screen, GREEN, (680, ship_y, 80, 30))
-                pygame.draw.circle(self.screen, RED, (720, ship_y + 15), 5)
-                
-        # Auto-advance story
-        if not self.skip_intro:
-            self.intro_timer += 1
-            if self.intro_timer >= 90:  # 1.5 seconds at 60 FPS
-                self.intro_timer = 0
-                if self.story_phase < len(story_lines) - 1:
-                    self.story_phase += 1
-                    
-    def draw_hud(self):
-        # Health bar
-        health_width = 200
-        health_height = 20
-        health_x = 10
-        health_y = 10
+    def handle_events(self):
+        running = True
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            else:
+                self.latency.observe(event)
+                self.scene.handle_event(event)
+        return running
         
-        # Background
-        pygame.draw.rect(self.screen, RED, (health_x, health_y, health_width, health_height))
+    def frame(self):
+        # Update and draw one frame of the current scene. The scene that was
+        # updated is the one drawn, even if the update moved to another state.
+        scene = self.scene
+        self.scheduler.tick()
+        scene.update()
+        self.record(scene)
+        self.submit(self.render_backend)
         
-        # Health
-        current_health_width = (self.player.health / self.player.max_health) * health_width
-        pygame.draw.rect(self.screen, GREEN, (health_x, health_y, current_health_width, health_height))
+    def record(self, scene):
+        # Viewports draw the world first, then the scene draws across the whole screen
+        scene.cull()
+        for viewport in self.viewports:
+            scene.draw_viewport(viewport)
+        scene.draw(self.render)
         
-        # Health text
-        health_text = self.small_font.render(f"Health: {int(self.player.health)}/{self.player.max_health}", True, WHITE)
-        self.screen.blit(health_text, (health_x, health_y + 25))
+    def submit(self, backend):
+        for viewport in self.viewports:
+            viewport.render.submit(backend, viewport.surface, viewport.offset_y)
+        self.render.submit(backend, self.screen)
         
-        # Progress bar
-        progress = (self.player.world_x / WORLD_WIDTH) * 100
-        progress_text = self.small_font.render(f"Progress: {progress:.1f}%", True, WHITE)
-        self.screen.blit(progress_text, (health_x, health_y + 50))
+    def step(self):
+        # One paced frame. The pacer may wait before input is read (low-latency
+        # mode) or after the flip (the default), but never in between.
+        self.pacer.begin_frame(self.fps)
+        running = self.handle_events()
+        self.frame()
+        pygame.display.flip()
+        self.latency.presented()
+        self.pacer.end_frame(self.fps)
+        return running
         
-        # Distance to Eva
-        distance_to_eva = max(0, self.eve.world_x - self.player.world_x)
-        if distance_to_eva > 0:
-            distance_text = self.small_font.render(f"Distance to Eva: {int(distance_to_eva)}m", True, YELLOW)
-            self.screen.blit(distance_text, (health_x, health_y + 75))
-        else:
-            rescue_text = self.small_font.render("Eva is near! Defeat the alien!", True, RED)
-            self.screen.blit(rescue_text, (health_x, health_y + 75))
-        
-        # Instructions
-        if self.state == GameState.PLAYING:
-            instructions = [
-                "Arrow Keys/WASD: Move",
-                "Space/Up: Jump",
-                "Avoid obstacles and reach Eva!"
-            ]
-            for i, instruction in enumerate(instructions):
-                text = self.small_font.render(instruction, True, WHITE)
-                self.screen.blit(text, (SCREEN_WIDTH - 250, 10 + i * 25))
-                
-    def draw_background(self):
-        # Parallax scrolling background
-        bg_x = -(self.camera_x * 0.5) % SCREEN_WIDTH
-        self.screen.blit(self.space_bg, (bg_x, 0))
-        if bg_x > 0:
-            self.screen.blit(self.space_bg, (bg_x - SCREEN_WIDTH, 0))
-                
     def run(self):
-        running = True
-        
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE and self.state == GameState.INTRO:
-                        if self.story_phase >= 7:  # All story shown
-                            self.state = GameState.PLAYING
-                    elif event.key == pygame.K_s and self.state == GameState.INTRO:
-                        self.state = GameState.PLAYING  # Skip intro
-                    elif event.key == pygame.K_r and (self.state == GameState.GAME_OVER or self.state == GameState.VICTORY):
-                        # Restart game
-                        self.__init__()
-                        
-            if self.state == GameState.INTRO:
-                self.draw_intro()
-                
-            elif self.state == GameState.PLAYING:
-                # Update
-                self.player.update(self.obstacles, self.camera_x)
-                self.eve.update()
-                for obstacle in self.obstacles:
-                    obstacle.update()
-                
-                self.update_camera()
-                    
-                # Check if player reached EVE (boss fight)
-                if self.player.world_x >= WORLD_WIDTH - 200:
-                    self.state = GameState.BOSS_FIGHT
-                    
-                # Check game over
-                if self.player.health <= 0:
-                    self.state = GameState.GAME_OVER
-                    
-                # Draw
-                self.draw_background()
-                
-                # Draw ground
-                ground_start = -self.camera_x % 100
-                for x in range(int(ground_start), SCREEN_WIDTH + 100, 100):
-                    pygame.draw.rect(self.screen, BROWN, (x, SCREEN_HEIGHT - 100, 100, 100))
-                
-                # Draw obstacles
-                for obstacle in self.obstacles:
-                    obstacle.draw(self.screen, self.camera_x)
-                    
-                # Draw characters
-                self.player.draw(self.screen)
-                
-                # Only show Eva when close
-                if self.player.world_x >= WORLD_WIDTH - 300:
-                    self.eve.draw(self.screen, self.camera_x)
-                
-                self.draw_hud()
-                
-            elif self.state == GameState.BOSS_FIGHT:
-                # Update
-                self.player.update([], self.camera_x)  # No obstacles during boss fight
-                self.alien.update(self.player, self.camera_x)
-                self.eve.update()
-                
-                self.update_camera()
-                
-                # Check if player can attack alien (simple collision)
-                if self.player.get_world_rect().colliderect(self.alien.get_world_rect()):
-                    self.alien.take_damage(3)  # Increased damage to compensate for higher health
-                    
-                # Check victory
-                if self.alien.health <= 0:
-                    self.state = GameState.VICTORY
-                    
-                # Check game over
-                if self.player.health <= 0:
-                    self.state = GameState.GAME_OVER
-                    
-                # Draw
-                self.draw_background()
-                
-                # Draw ground
-                ground_start = -self.camera_x % 100
-                for x in range(int(ground_start), SCREEN_WIDTH + 100, 100):
-                    pygame.draw.rect(self.screen, BROWN, (x, SCREEN_HEIGHT - 100, 100, 100))
-                
-                # Draw characters
-                self.player.draw(self.screen)
-                self.eve.draw(self.screen, self.camera_x)
-                self.alien.draw(self.screen, self.camera_x)
-                
-                # Boss health bar
-                boss_health_width = 400
-                boss_health_height = 25
-                boss_health_x = SCREEN_WIDTH // 2 - boss_health_width // 2
-                boss_health_y = 50
-                
-                # Health bar background
-                pygame.draw.rect(self.screen, RED, (boss_health_x, boss_health_y, boss_health_width, boss_health_height))
-                current_boss_health = (self.alien.health / self.alien.max_health) * boss_health_width
-                
-                # Health bar color changes based on phase
-                if self.alien.phase == 1:
-                    health_color = GREEN
-                elif self.alien.phase == 2:
-                    health_color = ORANGE
-                else:
-                    health_color = RED
-                
-                pygame.draw.rect(self.screen, health_color, (boss_health_x, boss_health_y, current_boss_health, boss_health_height))
-                
-                # Boss phase indicator
-                phase_text = f"ALIEN BOSS - PHASE {self.alien.phase}"
-                if self.alien.rage_mode:
-                    phase_text += " (RAGE MODE!)"
-                boss_text = self.font.render(phase_text, True, WHITE)
-                boss_text_rect = boss_text.get_rect(center=(SCREEN_WIDTH // 2, boss_health_y - 25))
-                self.screen.blit(boss_text, boss_text_rect)
-                
-                # Shield indicator
-                if self.alien.shield_active:
-                    shield_text = self.small_font.render("SHIELD ACTIVE!", True, CYAN)
-                    shield_rect = shield_text.get_rect(center=(SCREEN_WIDTH // 2, boss_health_y + 35))
-                    self.screen.blit(shield_text, shield_rect)
-                
-                # Enhanced instructions based on phase
-                if self.alien.phase == 1:
-                    fight_instructions = [
-                        "Touch the alien to attack!",
-                        "Avoid purple projectiles!"
-                    ]
-                elif self.alien.phase == 2:
-                    fight_instructions = [
-                        "Phase 2: Triple shots & homing missiles!",
-                        "Watch out for teleportation and shields!"
-                    ]
-                else:
-                    fight_instructions = [
-                        "RAGE MODE: Spread shots & laser beams!",
-                        "Maximum difficulty - stay mobile!"
-                    ]
-                
-                for i, instruction in enumerate(fight_instructions):
-                    color = WHITE if self.alien.phase == 1 else YELLOW if self.alien.phase == 2 else RED
-                    text = self.small_font.render(instruction, True, color)
-                    text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, boss_health_y + 60 + i * 25))
-                    self.screen.blit(text, text_rect)
-                
-                self.draw_hud()
-                
-            elif self.state == GameState.GAME_OVER:
-                self.screen.fill(BLACK)
-                game_over_text = self.large_font.render("MISSION FAILED", True, RED)
-                game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-                self.screen.blit(game_over_text, game_over_rect)
-                
-                reason_text = self.font.render("Wall-E couldn't save Eva...", True, WHITE)
-                reason_rect = reason_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(reason_text, reason_rect)
-                
-                restart_text = self.small_font.render("Press R to restart the rescue mission", True, YELLOW)
-                restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-                self.screen.blit(restart_text, restart_rect)
-                
-            elif self.state == GameState.VICTORY:
-                self.screen.fill(BLACK)
-                
-                # Victory animation
-                victory_text = self.large_font.render("MISSION ACCOMPLISHED!", True, GREEN)
-                victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-                self.screen.blit(victory_text, victory_rect)
-                
-                success_text = self.font.render("Eva has been rescued!", True, WHITE)
-                success_rect = success_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-                self.screen.blit(success_text, success_rect)
-                
-                # Draw happy Wall-E and Eva
-                pygame.draw.rect(self.screen, GRAY, (SCREEN_WIDTH // 2 - 60, SCREEN_HEIGHT // 2, 40, 40))
-                pygame.draw.rect(self.screen, YELLOW, (SCREEN_WIDTH // 2 - 55, SCREEN_HEIGHT // 2 + 5, 10, 10))
-                pygame.draw.rect(self.screen, YELLOW, (SCREEN_WIDTH // 2 - 35, SCREEN_HEIGHT // 2 + 5, 10, 10))
-                
-                pygame.draw.ellipse(self.screen, WHITE, (SCREEN_WIDTH // 2 + 20, SCREEN_HEIGHT // 2 - 5, 35, 50))
-                pygame.draw.circle(self.screen, BLUE, (SCREEN_WIDTH // 2 + 30, SCREEN_HEIGHT // 2 + 10), 4)
-                pygame.draw.circle(self.screen, BLUE, (SCREEN_WIDTH // 2 + 45, SCREEN_HEIGHT // 2 + 10), 4)
-                
-                # Hearts
-                for i in range(5):
-                    heart_x = SCREEN_WIDTH // 2 - 50 + i * 20
-                    heart_y = SCREEN_HEIGHT // 2 - 30 + math.sin(pygame.time.get_ticks() * 0.01 + i) * 5
-                    pygame.draw.circle(self.screen, RED, (int(heart_x), int(heart_y)), 3)
-                    pygame.draw.circle(self.screen, RED, (int(heart_x + 6), int(heart_y)), 3)
-                    pygame.draw.polygon(self.screen, RED, [(heart_x - 3, heart_y + 2), (heart_x + 9, heart_y + 2), (heart_x + 3, heart_y + 8)])
-                
-                restart_text = self.small_font.render("Press R to play again", True, YELLOW)
-                restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100))
-                self.screen.blit(restart_text, restart_rect)
-                
-            pygame.display.flip()
-            self.clock.tick(FPS)
+        while self.step():
+            pass
             
+        if self.run_started and self.state != GameState.GAME_OVER and self.state != GameState.VICTORY:
+            self.end_run('quit')
+        self.telemetry.close()
+        if self.latency is not NULL_LATENCY:
+            self.latency.report()
+        self.audio.stop()
         pygame.quit()
-        sys.exit()
+
+def parse_args(argv=None):
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Wall-E and Eva - Rescue Mission")
+    parser.add_argument("--telemetry", metavar="PATH", help="append gameplay events to a JSONL log")
+    parser.add_argument("--mute", action="store_true", help="play without sound")
+    parser.add_argument("--players", type=int, choices=sorted(SPLIT_LAYOUTS), default=1,
+                        help="local split-screen players")
+    parser.add_argument("--low-latency", action="store_true",
+                        help="sleep before reading input rather than after the flip")
+    parser.add_argument("--render-ahead", type=float, default=1.0, metavar="MS",
+                        help="low-latency safety margin on top of the predicted frame time")
+    parser.add_argument("--latency-report", action="store_true",
+                        help="print input-to-display latency percentiles on exit")
+    return parser.parse_args(argv)
+
+def create_game(args):
+    # Sounds load in the background while the intro is already on screen
+    game = Game(Telemetry(args.telemetry) if args.telemetry else NULL_TELEMETRY,
+                NULL_AUDIO if args.mute else AudioLoader(), args.players)
+    if args.low_latency:
+        game.pacer = LowLatencyPacer(args.render_ahead / 1000)
+    if args.latency_report:
+        game.latency = LatencyTracker()
+    return game
+
+def main(argv=None):
+    create_game(parse_args(argv)).run()
+    return 0
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    sys.exit(main())